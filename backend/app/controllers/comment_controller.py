@@ -1,9 +1,10 @@
 from fastapi import Request, HTTPException
-from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 import traceback
 from . import __init__ as _
+from ..responses import JSONResponse
 from ..models import user_model, post_model, comment_model
+from ..services import response_cache
 
 async def create_comment(request: Request, db: AsyncSession):
     try:
@@ -31,7 +32,9 @@ async def create_comment(request: Request, db: AsyncSession):
             raise HTTPException(status_code=400, detail="invalid_comment_create_request")
 
         comment = await comment_model.create_comment(db, post_id, user_id, content)
-        post = await post_model.update_comments_count(db, post, 1)
+        await post_model.update_comments_count(db, post_id, 1)
+        await db.commit()
+        response_cache.invalidate_post(post_id)
 
         return JSONResponse(
             status_code=201,
@@ -70,6 +73,7 @@ async def update_comment(comment_id: int, request: Request, db: AsyncSession):
             raise HTTPException(status_code=403, detail="forbidden_user")
 
         comment = await comment_model.update_comment(db, comment, content)
+        response_cache.invalidate_post(comment.post_id)
 
         return JSONResponse(
             status_code=200,
@@ -106,7 +110,9 @@ async def delete_comment(comment_id: int, request: Request, db: AsyncSession):
             raise HTTPException(status_code=403, detail="forbidden_user")
 
         await comment_model.delete_comment(db, comment_id)
-        post = await post_model.update_comments_count(db, post, -1)
+        await post_model.update_comments_count(db, post.post_id, -1)
+        await db.commit()
+        response_cache.invalidate_post(post.post_id)
 
         return JSONResponse(status_code=200, content={"detail": "comment_delete_success"})
     except HTTPException:
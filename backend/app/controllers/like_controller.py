@@ -1,9 +1,11 @@
 from fastapi import Request, HTTPException
-from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError
 import traceback
 from . import __init__ as _
+from ..responses import JSONResponse
 from ..models import user_model, post_model, like_model
+from ..services import response_cache
 
 
 async def create_like(request: Request, db: AsyncSession):
@@ -35,8 +37,15 @@ async def create_like(request: Request, db: AsyncSession):
         if like_for_me:
             raise HTTPException(status_code=400, detail="invalid_like_create_request")
         
-        like = await like_model.create_like(db, post_id, user_id)
-        post = await post_model.update_likes(db, post, 1)
+        try:
+            like = await like_model.create_like(db, post_id, user_id)
+        except IntegrityError:
+            # 동시에 들어온 중복 좋아요는 (post_id, user_id) unique 인덱스에서 막힘
+            await db.rollback()
+            raise HTTPException(status_code=400, detail="invalid_like_create_request")
+        await post_model.update_likes(db, post_id, 1)
+        await db.commit()
+        response_cache.invalidate_post(post_id)
 
         return JSONResponse(
             status_code=201,
@@ -73,7 +82,9 @@ async def delete_like(like_id: int, request: Request, db: AsyncSession):
             raise HTTPException(status_code=403, detail="forbidden_user")
 
         await like_model.delete_like(db, like_id)
-        post = await post_model.update_likes(db, post, -1)
+        await post_model.update_likes(db, post.post_id, -1)
+        await db.commit()
+        response_cache.invalidate_post(post.post_id)
 
         return JSONResponse(status_code=200, content={"detail": "like_delete_success"})
     except HTTPException:
@@ -1,46 +1,113 @@
 from fastapi import Request, HTTPException
-from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
+import os
+import asyncio
 import traceback
+from fastapi.responses import StreamingResponse
 from . import __init__ as _
+from .. import utils
+from ..responses import JSONResponse, conditional_json_response, precomputed, render_json
+from ..db import AsyncSessionLocal
 from ..models import user_model, post_model, comment_model, like_model
-from transformers import AutoTokenizer, AutoModelForSeq2SeqLM
+from ..services import response_cache, image_service
+from ..services.summary_jobs import summary_jobs
+from ..services.view_counter import view_counter
 
-model_path = "./ai/kobart-summary-v3"
+POSTS_MAX_COUNT = 100
+# 상세 응답에 넣는 첫 댓글 페이지 크기 / GET /posts/{post_id}/comments 기본 크기
+COMMENT_PAGE_SIZE = int(os.getenv("COMMENT_PAGE_SIZE", "20"))
+COMMENTS_MAX_COUNT = 100
+# GET /posts/{post_id}/summary/stream: 요약 완료를 기다리는 최대 시간 / DB 재확인 주기 (다른 워커가 처리하는 경우)
+SUMMARY_STREAM_TIMEOUT_SECONDS = float(os.getenv("SUMMARY_STREAM_TIMEOUT_SECONDS", "120"))
+SUMMARY_STREAM_POLL_SECONDS = 3
+# GET /posts/summaries/stream 한 연결에서 기다릴 수 있는 게시글 수
+SUMMARY_STREAM_MAX_POSTS = POSTS_MAX_COUNT
 
-tokenizer = AutoTokenizer.from_pretrained(model_path)
-model = AutoModelForSeq2SeqLM.from_pretrained(model_path)
 
-async def list_posts(cursor_id: int, count: int, db: AsyncSession):
-    if count <= 0 or cursor_id < 0:
+# 목록 / 댓글 행 -> 응답 dict (자주 쓰는 모양을 한 곳에서 만듦)
+def _post_list_item(p):
+    # p: post_model.POST_LIST_COLUMNS 행
+    return {
+        "post_id": p.post_id,
+        "title": p.title,
+        "author_nickname": p.author_nickname,
+        "author_profile_image": image_service.variant_url(p.author_profile_image, "avatar"),
+        "created_at": utils.format_timestamp(p.created_at),
+        "summary": p.summary,
+        "summary_status": p.summary_status,
+        "views": p.views,
+        "comments_count": p.comments_count,
+        "likes": p.likes,
+    }
+
+
+def _comment_item(c, author_nickname, author_profile_image):
+    return {
+        "comment_id": c.comment_id,
+        "content": c.content,
+        "author_nickname": author_nickname,
+        "author_profile_image": image_service.variant_url(author_profile_image, "avatar"),
+        "created_at": utils.format_timestamp(c.created_at),
+        "user_id": c.user_id,
+    }
+
+
+async def _load_comment_page(db: AsyncSession, post_id: int, cursor_id: int, count: int):
+    # 한 개 더 읽어서 다음 페이지 존재 여부 판단
+    rows = await comment_model.get_comment_with_author_by_post_id(db, post_id, cursor_id, count + 1)
+    sliced = rows[:count]
+    has_more = len(rows) > count
+    next_cursor = sliced[-1][0].comment_id if sliced else cursor_id
+    return [_comment_item(*row) for row in sliced], next_cursor, has_more
+
+
+async def list_posts(cursor_id: int, count: int, order: str, cursor: str | None, request: Request, db: AsyncSession):
+    if cursor:
+        try:
+            cursor_id, order = utils.decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="invalid_posts_list_request")
+    if count <= 0 or cursor_id < 0 or order not in ("asc", "desc"):
         raise HTTPException(status_code=400, detail="invalid_posts_list_request")
+    count = min(count, POSTS_MAX_COUNT)
     try:
-        filtered = await post_model.get_post_list_by_id(db, cursor_id)
-        sliced = filtered[:count]
-        next_cursor = sliced[-1].post_id if sliced else cursor_id
-
-        data_list = []
-        for p in sliced:
-            author = await user_model.get_user_by_id(db, p.user_id)
-            data_list.append(
-                {
-                    "post_id": p.post_id,
-                    "title": p.title,
-                    "author_nickname": author.nickname,
-                    "author_profile_image": author.profile_image,
-                    "created_at": p.created_at.strftime("%Y-%m-%d %H:%M:%S") if p.created_at else None,
-                    "summary": p.summary,
-                    "views": p.views,
-                    "comments_count": p.comments_count,
-                    "likes": p.likes,
-                }
+        cache_key = (cursor_id, count, order)
+        cached = response_cache.post_list_cache.get(cache_key)
+        if cached is None:
+            # 한 개 더 읽어서 다음 페이지 존재 여부 판단
+            filtered = await post_model.get_post_list_by_id(db, cursor_id, count + 1, order)
+            sliced = filtered[:count]
+            has_more = len(filtered) > count
+            next_cursor = sliced[-1].post_id if sliced else cursor_id
+
+            data_list = [_post_list_item(row) for row in sliced]
+            data = {
+                "post_list": data_list,
+                "next_cursor": next_cursor,
+                "next_page_cursor": utils.encode_cursor(next_cursor, order),
+                "has_more": has_more,
+            }
+            modified = [p.updated_at or p.created_at for p in sliced if p.updated_at or p.created_at]
+            cached = (data, max(modified) if modified else None)
+            post_ids = [row.post_id for row in filtered]
+            response_cache.post_list_cache.set(
+                cache_key, cached, response_cache.list_page_tags(post_ids, cursor_id, order, has_more)
             )
-        return JSONResponse(
-            status_code=200,
-            content={
-                "detail": "posts_list_success",
-                "data": {"post_list": data_list, "next_cursor": next_cursor},
-            },
+        data, last_modified = cached
+
+        # 캐시된 페이지는 사용자 공통, 내 좋아요 여부는 페이지 전체를 IN 쿼리 한 번으로 붙임
+        session_user_id = request.session.get("user_id")
+        post_ids = [item["post_id"] for item in data["post_list"]]
+        my_likes = await like_model.get_my_likes(db, post_ids, session_user_id) if session_user_id else {}
+        post_list = [
+            {**item, "is_liked_by_me": item["post_id"] in my_likes, "like_id": my_likes.get(item["post_id"])}
+            for item in data["post_list"]
+        ]
+
+        return conditional_json_response(
+            request,
+            {"detail": "posts_list_success", "data": {**data, "post_list": post_list}},
+            last_modified=last_modified,
         )
     except HTTPException:
         raise
@@ -75,15 +142,17 @@ async def create_post(request: Request, db: AsyncSession):
         if user_id != session_user_id:
             raise HTTPException(status_code=403, detail="forbidden_user")
         
-        inputs = tokenizer(content, return_tensors="pt")
-        summary_ids = model.generate(**inputs, max_length=200)
-        summary = tokenizer.decode(summary_ids[0], skip_special_tokens=True)
-        
-        post = await post_model.create_post(db, user_id, title, content, summary, image_url, user.nickname)
+        # 요약을 기다리지 않고 바로 저장, 요약은 백그라운드 작업이 채움
+        # (완료 확인: GET /posts/{post_id}/summary 또는 /summary/stream)
+        post = await post_model.create_post(
+            db, user_id, title, content, None, image_url, user.nickname, summary_status="pending"
+        )
+        response_cache.invalidate_new_post()
+        summary_jobs.submit(post.post_id, content)
 
         return JSONResponse(
             status_code=201,
-            content={"detail": "post_create_success", "data": {"post_id": post.post_id}},
+            content={"detail": "post_create_success", "data": {"post_id": post.post_id, "summary_status": "pending"}},
         )
     except HTTPException:
         raise
@@ -122,15 +191,22 @@ async def update_post(post_id: int, request: Request, db: AsyncSession):
         if post.user_id != request.session["user_id"]:
             raise HTTPException(status_code=403, detail="forbidden_user")
         
-        inputs = tokenizer(content, return_tensors="pt")
-        summary_ids = model.generate(**inputs, max_length=200)
-        summary = tokenizer.decode(summary_ids[0], skip_special_tokens=True)
+        # 본문이 그대로면 (제목/이미지만 수정) 기존 요약 또는 진행 중인 작업 재사용
+        # 본문이 바뀌었거나 이전 요약이 실패했으면 백그라운드에서 다시 요약
+        resummarize = not (content == post.content and (post.summary or post.summary_status == "pending"))
+        if resummarize:
+            summary, summary_status, summarizer = None, "pending", None
+        else:
+            summary, summary_status, summarizer = post.summary, post.summary_status, post.summarizer
         
-        post = await post_model.update_post(db, post, title, content, summary, image_url)
+        post = await post_model.update_post(db, post, title, content, summary, image_url, summary_status, summarizer)
+        response_cache.invalidate_post(post_id)
+        if resummarize:
+            summary_jobs.submit(post_id, content)
 
         return JSONResponse(
             status_code=200,
-            content={"detail": "post_update_success", "data": {"post_id": post_id}},
+            content={"detail": "post_update_success", "data": {"post_id": post_id, "summary_status": summary_status}},
         )
     except HTTPException:
         raise
@@ -140,68 +216,215 @@ async def update_post(post_id: int, request: Request, db: AsyncSession):
         raise HTTPException(status_code=500, detail="internal_server_error")
 
 
+async def _build_post_detail(db: AsyncSession, post_id: int):
+    row = await post_model.get_post_with_author(db, post_id)
+    if not row:
+        return None
+    post, post_author_nickname, _ = row
+
+    # 첫 댓글 페이지만 포함, 나머지는 GET /posts/{post_id}/comments?cursor_id=comments_next_cursor
+    comments, comments_next_cursor, comments_has_more = await _load_comment_page(db, post_id, 0, COMMENT_PAGE_SIZE)
+    # 댓글 목록은 캐시에 있는 동안 다시 직렬화하지 않도록 미리 직렬화
+    comments_json = precomputed(comments)
+
+    detail = {
+        "post_id": post.post_id,
+        "title": post.title,
+        "content": post.content,
+        "image_url": getattr(post, "image_url", None),
+        "image_thumb_url": image_service.variant_url(getattr(post, "image_url", None), "thumb"),
+        "author_nickname": post_author_nickname,
+        "author_user_id": post.user_id,
+        "created_at": utils.format_timestamp(post.created_at),
+        "updated_at": utils.format_timestamp(post.created_at),
+        "summary": post.summary,
+        "summary_status": post.summary_status,
+        "summarizer": post.summarizer,
+        "views": post.views or 0,
+        "likes": post.likes,
+        "comments_count": post.comments_count,
+        "comments": comments_json,
+        "comments_next_cursor": comments_next_cursor,
+        "comments_has_more": comments_has_more,
+    }
+    return detail, post.updated_at or post.created_at
+
+
 async def get_post_detail(post_id: int, request: Request, db: AsyncSession):
     if post_id < 0:
         raise HTTPException(status_code=400, detail="invalid_posts_detail_request")
 
-    post = await post_model.get_post_by_id(db, post_id)
-    if not post:
-        raise HTTPException(status_code=404, detail="post_not_found")
+    cached = response_cache.post_detail_cache.get(post_id)
+    if cached is None:
+        cached = await _build_post_detail(db, post_id)
+        if not cached:
+            raise HTTPException(status_code=404, detail="post_not_found")
+        response_cache.post_detail_cache.set(post_id, cached)
+    detail, last_modified = cached
     try:
         session_user_id = request.session.get("user_id")
         if not session_user_id:
             raise HTTPException(status_code=401, detail="unauthorized_user")
 
-        post_comments = await comment_model.get_comment_by_post_id(db, post_id)
         like_for_me = await like_model.get_my_like(db, post_id, session_user_id)
+        pending_views = view_counter.increment(post_id)
 
-        comments_json = []
-        for c in post_comments:
-            author = await user_model.get_user_by_id(db, c.user_id)
-            comments_json.append(
-                {
-                    "comment_id": c.comment_id,
-                    "content": c.content,
-                    "author_nickname": author.nickname,
-                    "author_profile_image": author.profile_image,
-                    "created_at": c.created_at.strftime("%Y-%m-%d %H:%M:%S") if c.created_at else None,
-                    "user_id": c.user_id,
-                }
-            )
+        data = {
+            **detail,
+            "is_liked_by_me": like_for_me is not None,
+            "like_id": like_for_me.like_id if like_for_me else None,
+        }
+        # 조회할 때마다 조회수가 바뀌므로 ETag 에서는 조회수를 제외 (조회수만 바뀐 경우 304)
+        return conditional_json_response(
+            request,
+            {"detail": "post_detail_success", "data": {**data, "views": detail["views"] + pending_views}},
+            last_modified=last_modified,
+            etag_content={**data, "views": None},
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        print("[post-detail] unexpected error:", repr(e))
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail="internal_server_error")
 
-        await post_model.update_views(db, post)
-        author = await user_model.get_user_by_id(db, post.user_id)
 
+async def list_comments(post_id: int, cursor_id: int, count: int | None, request: Request, db: AsyncSession):
+    count = COMMENT_PAGE_SIZE if count is None else count
+    if post_id < 0 or cursor_id < 0 or count <= 0:
+        raise HTTPException(status_code=400, detail="invalid_comments_list_request")
+    count = min(count, COMMENTS_MAX_COUNT)
+    try:
+        session_user_id = request.session.get("user_id")
+        if not session_user_id:
+            raise HTTPException(status_code=401, detail="unauthorized_user")
+
+        cache_key = (post_id, cursor_id, count)
+        data = response_cache.comment_page_cache.get(cache_key)
+        if data is None:
+            comments, next_cursor, has_more = await _load_comment_page(db, post_id, cursor_id, count)
+            # 빈 페이지일 때만 게시글 존재 확인 (댓글이 있으면 게시글도 있음)
+            if not comments and not await post_model.get_post_by_id(db, post_id):
+                raise HTTPException(status_code=404, detail="post_not_found")
+            data = {"comment_list": comments, "next_cursor": next_cursor, "has_more": has_more}
+            response_cache.comment_page_cache.set(cache_key, data, (response_cache.post_tag(post_id),))
+
+        return conditional_json_response(request, {"detail": "comments_list_success", "data": data})
+    except HTTPException:
+        raise
+    except Exception as e:
+        print("[comment-list] unexpected error:", repr(e))
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail="internal_server_error")
+
+
+async def get_post_summary(post_id: int, request: Request, db: AsyncSession):
+    if post_id < 0:
+        raise HTTPException(status_code=400, detail="invalid_post_summary_request")
+    try:
+        session_user_id = request.session.get("user_id")
+        if not session_user_id:
+            raise HTTPException(status_code=401, detail="unauthorized_user")
+
+        row = await post_model.get_post_summary(db, post_id)
+        if row is None:
+            raise HTTPException(status_code=404, detail="post_not_found")
         return JSONResponse(
             status_code=200,
             content={
-                "detail": "post_detail_success",
+                "detail": "post_summary_success",
                 "data": {
-                    "post_id": post.post_id,
-                    "title": post.title,
-                    "content": post.content,
-                    "image_url": getattr(post, "image_url", None),
-                    "author_nickname": author.nickname,
-                    "author_user_id": post.user_id,
-                    "created_at": post.created_at.strftime("%Y-%m-%d %H:%M:%S") if post.created_at else None,
-                    "updated_at": post.created_at.strftime("%Y-%m-%d %H:%M:%S") if post.created_at else None,
-                    "views": post.views,
-                    "likes": post.likes,
-                    "comments_count": post.comments_count,
-                    "comments": comments_json,
-                    "is_liked_by_me": like_for_me is not None,
-                    "like_id": like_for_me.like_id if like_for_me else None,
+                    "post_id": post_id,
+                    "summary": row.summary,
+                    "summary_status": row.summary_status,
+                    "summarizer": row.summarizer,
                 },
             },
         )
     except HTTPException:
         raise
     except Exception as e:
-        print("[post-detail] unexpected error:", repr(e))
+        print("[post-summary] unexpected error:", repr(e))
         traceback.print_exc()
         raise HTTPException(status_code=500, detail="internal_server_error")
 
 
+def _sse_event(event: str, data) -> str:
+    return f"event: {event}\ndata: {render_json(data).decode('utf-8')}\n\n"
+
+
+async def _summary_events(post_ids: list[int]):
+    # 게시글마다 요약이 끝나면 summary 이벤트를 보내고, 모두 끝나면 종료 (기다리는 동안 커넥션은 잡지 않음)
+    # 목록의 요약 대기 글 여러 개를 연결 하나로 기다림 (HTTP/1.1 은 origin 당 연결 6개 제한)
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + SUMMARY_STREAM_TIMEOUT_SECONDS
+    waiting = list(dict.fromkeys(post_ids))
+    try:
+        while True:
+            async with AsyncSessionLocal() as db:
+                rows = {row.post_id: row for row in await post_model.get_post_summaries(db, waiting)}
+            still_waiting = []
+            for post_id in waiting:
+                row = rows.get(post_id)
+                if row is None:
+                    yield _sse_event("error", {"post_id": post_id, "detail": "post_not_found"})
+                    continue
+                data = {
+                    "post_id": post_id,
+                    "summary": row.summary,
+                    "summary_status": row.summary_status,
+                    "summarizer": row.summarizer,
+                }
+                if row.summary_status != "pending":
+                    yield _sse_event("summary", data)
+                elif loop.time() >= deadline:
+                    yield _sse_event("timeout", data)
+                else:
+                    still_waiting.append(post_id)
+            waiting = still_waiting
+            if not waiting:
+                return
+            # 프록시가 idle 연결을 끊지 않도록 주석 줄 전송
+            yield ": pending\n\n"
+            remaining = deadline - loop.time()
+            await summary_jobs.wait_for_update(waiting, max(0, min(SUMMARY_STREAM_POLL_SECONDS, remaining)))
+    except Exception as e:
+        print("[post-summary-stream] unexpected error:", repr(e))
+        traceback.print_exc()
+        yield _sse_event("error", {"detail": "internal_server_error"})
+
+
+async def stream_post_summary(post_id: int, request: Request):
+    if post_id < 0:
+        raise HTTPException(status_code=400, detail="invalid_post_summary_request")
+    session_user_id = request.session.get("user_id")
+    if not session_user_id:
+        raise HTTPException(status_code=401, detail="unauthorized_user")
+    return _summary_stream_response([post_id])
+
+
+async def stream_post_summaries(post_ids: str, request: Request):
+    # post_ids: 쉼표로 구분한 게시글 id (목록 한 페이지의 요약 대기 글)
+    try:
+        ids = [int(post_id) for post_id in post_ids.split(",") if post_id.strip()]
+    except ValueError:
+        raise HTTPException(status_code=400, detail="invalid_post_summary_request")
+    if not ids or len(ids) > SUMMARY_STREAM_MAX_POSTS or any(post_id < 0 for post_id in ids):
+        raise HTTPException(status_code=400, detail="invalid_post_summary_request")
+    session_user_id = request.session.get("user_id")
+    if not session_user_id:
+        raise HTTPException(status_code=401, detail="unauthorized_user")
+    return _summary_stream_response(ids)
+
+
+def _summary_stream_response(post_ids: list[int]) -> StreamingResponse:
+    return StreamingResponse(
+        _summary_events(post_ids),
+        media_type="text/event-stream",
+        headers={"cache-control": "no-cache", "x-accel-buffering": "no"},
+    )
+
+
 async def delete_post(post_id: int, request: Request, db: AsyncSession):
     if post_id < 0:
         raise HTTPException(status_code=400, detail="invalid_post_delete_request")
@@ -218,6 +441,7 @@ async def delete_post(post_id: int, request: Request, db: AsyncSession):
             raise HTTPException(status_code=403, detail="forbidden_user")
         
         await post_model.delete_post(db, post_id)
+        response_cache.invalidate_post(post_id)
         return JSONResponse(status_code=200, content={"detail": "post_delete_success"})
     except HTTPException:
         raise
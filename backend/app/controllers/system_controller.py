@@ -0,0 +1,55 @@
+from fastapi import HTTPException
+import traceback
+from . import __init__ as _
+from ..responses import JSONResponse
+from .. import db
+from ..services import summary_service, response_cache
+from ..services.summary_cache import summary_cache
+
+
+async def get_readiness():
+    try:
+        status = summary_service.model_status()
+        if status["model_state"] != "ready":
+            return JSONResponse(status_code=503, content={"detail": "not_ready", "data": status})
+        return JSONResponse(status_code=200, content={"detail": "ready", "data": status})
+    except Exception as e:
+        print("[readiness] unexpected error:", repr(e))
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail="internal_server_error")
+
+
+async def get_summary_cache_stats():
+    try:
+        return JSONResponse(
+            status_code=200,
+            content={"detail": "summary_cache_stats_success", "data": summary_cache.stats()},
+        )
+    except Exception as e:
+        print("[summary-cache-stats] unexpected error:", repr(e))
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail="internal_server_error")
+
+
+async def get_response_cache_stats():
+    try:
+        return JSONResponse(
+            status_code=200,
+            content={"detail": "response_cache_stats_success", "data": response_cache.stats()},
+        )
+    except Exception as e:
+        print("[response-cache-stats] unexpected error:", repr(e))
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail="internal_server_error")
+
+
+async def get_db_pool_stats():
+    try:
+        return JSONResponse(
+            status_code=200,
+            content={"detail": "db_pool_stats_success", "data": db.pool_status()},
+        )
+    except Exception as e:
+        print("[db-pool-stats] unexpected error:", repr(e))
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail="internal_server_error")
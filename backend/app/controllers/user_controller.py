@@ -1,13 +1,13 @@
 from fastapi import Request, HTTPException, UploadFile
-from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from pathlib import Path
 import traceback
-import os
 import uuid
 from . import __init__ as _
+from ..responses import JSONResponse
 from .. import utils
+from ..db import release_connection
 from ..models import user_model
+from ..services import response_cache, image_service
 
 async def login(request: Request, db: AsyncSession):
     try:
@@ -22,8 +22,16 @@ async def login(request: Request, db: AsyncSession):
             raise HTTPException(status_code=400, detail="invalid_login_request")
 
         user = await user_model.get_user_by_email(db, email)        
-        if not user or not await utils.verify_password_async(password, user.password):
+        await release_connection(db)
+        if not user:
+            raise HTTPException(status_code=401, detail="login_invalid_email_or_pwd")
+
+        verified, new_hash = await utils.verify_and_update_password_async(password, user.password)
+        if not verified:
             raise HTTPException(status_code=401, detail="login_invalid_email_or_pwd")
+        if new_hash:
+            # 예전 bcrypt cost 로 저장된 해시는 로그인 성공 시 현재 설정으로 다시 저장
+            await user_model.update_user_password(db, user, new_hash)
 
         session_id = request.session.get("sessionID")
         session_email = request.session.get("email")
@@ -94,6 +102,7 @@ async def signup(request: Request, db: AsyncSession):
         if await user_model.get_user_by_email(db, email):
             raise HTTPException(status_code=400, detail="invalid_signup_request")
 
+        await release_connection(db)
         hashed_password = await utils.hash_password_async(password)
 
         user = await user_model.create_user(db, email, hashed_password, nickname, profile_image)
@@ -189,6 +198,8 @@ async def update_me(user_id: int, request: Request, db: AsyncSession):
             raise HTTPException(status_code=403, detail="forbidden_user")
 
         user = await user_model.update_user_profile(db, user, nickname, profile_image)
+        # 게시글/댓글 캐시에 작성자 닉네임, 프로필 이미지가 들어 있음
+        response_cache.invalidate_all()
 
         return JSONResponse(
             status_code=200,
@@ -233,6 +244,7 @@ async def update_password(user_id: int, request: Request, db: AsyncSession):
         if user_id != session_user_id:
             raise HTTPException(status_code=403, detail="forbidden_user")
         
+        await release_connection(db)
         if not await utils.verify_password_async(current_password, user.password):
             raise HTTPException(status_code=400, detail="invalid_password")
         
@@ -291,6 +303,7 @@ async def delete_user(user_id: int, request: Request, db: AsyncSession):
         request.session.clear()
         
         await user_model.delete_user(db, user_id)
+        response_cache.invalidate_all()
         return JSONResponse(status_code=200, content={"detail": "user_delete_success"})
     except HTTPException:
         raise
@@ -303,41 +316,26 @@ async def delete_user(user_id: int, request: Request, db: AsyncSession):
 async def upload_image (file: UploadFile):
     if not file:
         raise HTTPException(status_code=400, detail="invalid_image_upload_request")
-    if not file.content_type.startswith("image/"):
-        raise HTTPException(status_code=400, detail="invalid_image_upload_request")
     try:
-        PROJECT_ROOT = Path(__file__).resolve().parents[3]
-        IMAGE_DIR = PROJECT_ROOT / "image"
-
-        original_name = file.filename or ""
-        ext = os.path.splitext(original_name)[1].lower()
-
-        unique_name = f"{uuid.uuid4().hex}{ext}"
-        save_path = IMAGE_DIR / unique_name
-
-        with save_path.open("wb") as buffer:
-            while True:
-                chunk = await file.read(1024 * 1024)  # 1MB씩
-                if not chunk:
-                    break
-                buffer.write(chunk)
-
-        public_path = f"/image/{unique_name}"
-        base_url = "http://localhost:8000"
-        public_path = base_url + public_path
+        file_name = await image_service.save_upload(file)
+        image_service.schedule_derivatives(file_name)
 
         return JSONResponse(
             status_code=201,
             content={
                 "detail": "image_upload_success",
                 "data": {
-                    "file_path": public_path
+                    "file_path": image_service.public_url(file_name)
                 },
             },
         )
+    except image_service.InvalidImageError:
+        raise HTTPException(status_code=400, detail="invalid_image_upload_request")
+    except image_service.ImageTooLargeError:
+        raise HTTPException(status_code=413, detail="image_too_large")
     except HTTPException:
         raise
     except Exception as e:
         print("[upload-image] unexpected error:", repr(e))
         traceback.print_exc()
-        raise HTTPException(status_code=500, detail="internal_server_error")                 
\ No newline at end of file
+        raise HTTPException(status_code=500, detail="internal_server_error")
@@ -1,6 +1,9 @@
 import os
+import time
 from dotenv import load_dotenv
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from collections.abc import AsyncGenerator
 from sqlalchemy.orm import declarative_base
 
@@ -15,12 +18,99 @@ DB_CHARSET = os.getenv("DB_CHARSET", "utf8mb4")
 
 DATABASE_URL = f"mysql+asyncmy://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}?charset={DB_CHARSET}"
 
-engine = create_async_engine(DATABASE_URL, echo=True, future=True)
+# DB_PROFILE 별 기본값, 각 항목은 환경 변수로 덮어쓸 수 있음
+# pool_recycle 은 MySQL wait_timeout(기본 8시간)보다 짧게 두어 끊긴 연결을 재사용하지 않도록
+ENGINE_PROFILES = {
+    "dev": {
+        "DB_ECHO": "0",
+        "DB_POOL_SIZE": "5",
+        "DB_MAX_OVERFLOW": "5",
+        "DB_POOL_TIMEOUT": "30",
+        "DB_POOL_RECYCLE": "3600",
+        "DB_POOL_PRE_PING": "1",
+    },
+    "prod": {
+        "DB_ECHO": "0",
+        "DB_POOL_SIZE": "10",
+        "DB_MAX_OVERFLOW": "10",
+        "DB_POOL_TIMEOUT": "5",
+        "DB_POOL_RECYCLE": "1800",
+        "DB_POOL_PRE_PING": "1",
+    },
+}
+
+DB_PROFILE = os.getenv("DB_PROFILE", "dev")
+if DB_PROFILE not in ENGINE_PROFILES:
+    raise ValueError(f"unknown DB_PROFILE: {DB_PROFILE}")
+
+
+def engine_setting(name: str) -> str:
+    return os.getenv(name, ENGINE_PROFILES[DB_PROFILE][name])
+
+
+pool_wait_stats = {"checkouts": 0, "timeouts": 0, "total_wait_ms": 0.0, "max_wait_ms": 0.0}
+
+
+class MeasuredQueuePool(AsyncAdaptedQueuePool):
+    # 커넥션을 얻기까지 기다린 시간을 기록 (풀 크기를 데이터로 정하기 위함)
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            pool_wait_stats["timeouts"] += 1
+            raise
+        finally:
+            waited_ms = (time.perf_counter() - started) * 1000
+            pool_wait_stats["checkouts"] += 1
+            pool_wait_stats["total_wait_ms"] += waited_ms
+            pool_wait_stats["max_wait_ms"] = max(pool_wait_stats["max_wait_ms"], waited_ms)
+
+
+engine = create_async_engine(
+    DATABASE_URL,
+    echo=engine_setting("DB_ECHO") == "1",
+    future=True,
+    poolclass=MeasuredQueuePool,
+    pool_size=int(engine_setting("DB_POOL_SIZE")),
+    max_overflow=int(engine_setting("DB_MAX_OVERFLOW")),
+    pool_timeout=float(engine_setting("DB_POOL_TIMEOUT")),
+    pool_recycle=int(engine_setting("DB_POOL_RECYCLE")),
+    pool_pre_ping=engine_setting("DB_POOL_PRE_PING") == "1",
+)
 
 AsyncSessionLocal = async_sessionmaker(bind=engine, class_=AsyncSession, autoflush=False, expire_on_commit=False,)
 
 Base = declarative_base()
 
+
+def pool_status() -> dict:
+    pool = engine.sync_engine.pool
+    checkouts = pool_wait_stats["checkouts"]
+    return {
+        "profile": DB_PROFILE,
+        "pool_size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        # QueuePool.overflow() 는 풀이 다 차기 전에는 음수
+        "overflow": max(pool.overflow(), 0),
+        "max_overflow": int(engine_setting("DB_MAX_OVERFLOW")),
+        "checkouts": checkouts,
+        "timeouts": pool_wait_stats["timeouts"],
+        "avg_wait_ms": round(pool_wait_stats["total_wait_ms"] / checkouts, 3) if checkouts else 0.0,
+        "max_wait_ms": round(pool_wait_stats["max_wait_ms"], 3),
+    }
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    # AsyncSession 은 첫 쿼리 때 풀에서 커넥션을 꺼내고 commit / rollback / close 때 돌려줌
+    # -> DB 를 쓰지 않는 요청(캐시 적중 등)은 커넥션을 잡지 않음
     async with AsyncSessionLocal() as session:
         yield session
+
+
+async def release_connection(session: AsyncSession):
+    # 조회만 한 트랜잭션을 끝내고 커넥션을 풀에 반납 (요약 생성, bcrypt 처럼 오래 걸리는 작업 전에 호출)
+    # rollback 은 읽어 둔 객체를 expire 시키므로 commit 사용 (expire_on_commit=False)
+    if session.in_transaction():
+        await session.commit()
@@ -1,8 +1,14 @@
-from sqlalchemy import Column, Integer, ForeignKey, DateTime, Text, func
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Text, Index, func
 from app.db import Base
 
 class Comment(Base):
     __tablename__ = "comments"
+    __table_args__ = (
+        # get_comment_by_post_id: WHERE post_id = ? ORDER BY comment_id
+        # 댓글 페이지: WHERE post_id = ? AND comment_id > ? ORDER BY comment_id LIMIT ?
+        Index("ix_comments_post_id_comment_id", "post_id", "comment_id"),
+        Index("ix_comments_user_id", "user_id"),
+    )
 
     comment_id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     post_id = Column(Integer, ForeignKey("posts.post_id", ondelete="CASCADE"), nullable=False)
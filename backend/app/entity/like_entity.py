@@ -1,10 +1,15 @@
-from sqlalchemy import Column, Integer, ForeignKey
+from sqlalchemy import Column, Integer, ForeignKey, Index
 from app.db import Base
 
 class Like(Base):
     __tablename__ = "likes"
+    __table_args__ = (
+        # get_my_like: WHERE post_id = ? AND user_id = ? / 같은 게시글 중복 좋아요 방지
+        Index("ux_likes_post_id_user_id", "post_id", "user_id", unique=True),
+        # get_my_likes: WHERE user_id = ? AND post_id IN (...)
+        Index("ix_likes_user_id_post_id", "user_id", "post_id"),
+    )
 
     like_id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     post_id =Column(Integer, ForeignKey("posts.post_id", ondelete="CASCADE"), nullable=False)
     user_id = Column(Integer, ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False)
-
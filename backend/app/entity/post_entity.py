@@ -1,14 +1,24 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, func
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Index, func
 from app.db import Base
 
 class Post(Base):
     __tablename__ = "posts"
+    __table_args__ = (
+        # 목록(오래된 순/최신 순)은 PK(post_id) 인덱스를 양방향으로 사용, 사용자별 조회는 아래 인덱스
+        Index("ix_posts_user_id_post_id", "user_id", "post_id"),
+        # 서버 시작 시 요약 대기(pending) 게시글 다시 큐에 넣기
+        Index("ix_posts_summary_status", "summary_status"),
+    )
 
     post_id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     user_id = Column(Integer, ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False)
     title = Column(String(255), nullable=False)
     content = Column(Text, nullable=False)
     summary = Column(String(255), nullable=True)
+    # pending -> done / failed (요약은 작성 후 백그라운드에서 채움)
+    summary_status = Column(String(10), nullable=False, server_default="done")
+    # 요약을 만든 방식: kobart / extractive (NULL = 컬럼 추가 전 또는 요약 없음), extractive 는 나중에 kobart 로 다시 요약 가능
+    summarizer = Column(String(20), nullable=True)
     image_url = Column(String(500), nullable=True)
     author_nickname = Column(String(50), nullable=False)
     created_at = Column(DateTime, server_default=func.now())
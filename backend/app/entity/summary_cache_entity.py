@@ -0,0 +1,9 @@
+from sqlalchemy import Column, String, DateTime, Text, func
+from app.db import Base
+
+class SummaryCache(Base):
+    __tablename__ = "summary_cache"
+
+    cache_key = Column(String(64), primary_key=True)
+    summary = Column(Text, nullable=False)
+    created_at = Column(DateTime, server_default=func.now())
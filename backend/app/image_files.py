@@ -0,0 +1,99 @@
+import os
+import re
+import anyio
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import StaticFiles, NotModifiedResponse
+from starlette.types import Scope, Receive, Send
+
+# 업로드 이미지는 <sha256> 또는 <uuid hex> 이름(+ _thumb/_avatar 변형)이라 같은 URL 의 내용이 바뀌지 않음
+IMMUTABLE_NAME = re.compile(r"^(?P<stem>[0-9a-f]{64}|[0-9a-f]{32})(?P<variant>_[a-z]+)?\.[a-z0-9]+$")
+CONTENT_HASH_NAME = re.compile(r"^[0-9a-f]{64}(_[a-z]+)?\.[a-z0-9]+$")
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+DEFAULT_CACHE_CONTROL = "no-cache"
+RANGE_HEADER = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class RangeFileResponse(FileResponse):
+    # 206 Partial Content: 요청한 구간만 잘라서 전송
+    def __init__(self, path, start: int, end: int, headers=None, stat_result=None):
+        super().__init__(path, status_code=206, headers=headers, stat_result=stat_result)
+        self.start = start
+        self.end = end
+        self.headers["content-length"] = str(end - start + 1)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+        if scope["method"].upper() == "HEAD":
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            return
+        async with await anyio.open_file(self.path, mode="rb") as file:
+            await file.seek(self.start)
+            remaining = self.end - self.start + 1
+            while remaining > 0:
+                chunk = await file.read(min(self.chunk_size, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                await send({"type": "http.response.body", "body": chunk, "more_body": remaining > 0})
+            if remaining > 0:
+                await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+
+def parse_range(range_header: str, size: int):
+    # 단일 구간만 지원, 여러 구간 요청은 None -> 전체 전송 (RFC 9110 상 허용)
+    match = RANGE_HEADER.match(range_header.strip())
+    if not match:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        length = int(last)
+        if length == 0:
+            raise ValueError("unsatisfiable_range")
+        return max(size - length, 0), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        raise ValueError("unsatisfiable_range")
+    return start, end
+
+
+class ImageFiles(StaticFiles):
+    def file_response(self, full_path, stat_result: os.stat_result, scope: Scope, status_code: int = 200) -> Response:
+        request_headers = Headers(scope=scope)
+        file_name = os.path.basename(full_path)
+
+        headers = {"accept-ranges": "bytes"}
+        if IMMUTABLE_NAME.match(file_name):
+            headers["cache-control"] = IMMUTABLE_CACHE_CONTROL
+        else:
+            headers["cache-control"] = DEFAULT_CACHE_CONTROL
+        if CONTENT_HASH_NAME.match(file_name):
+            # 파일 이름이 곧 내용의 해시 -> 강한 ETag 로 그대로 사용
+            headers["etag"] = f'"{os.path.splitext(file_name)[0]}"'
+
+        # FileResponse 는 서버가 http.response.pathsend 를 지원하면 파일 경로만 넘겨 zero-copy 전송
+        response = FileResponse(full_path, status_code=status_code, headers=headers, stat_result=stat_result)
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+
+        range_header = request_headers.get("range")
+        if range_header is None or status_code != 200:
+            return response
+        if_range = request_headers.get("if-range")
+        if if_range is not None and if_range != response.headers["etag"]:
+            return response
+        try:
+            byte_range = parse_range(range_header, stat_result.st_size)
+        except ValueError:
+            return Response(
+                status_code=416,
+                headers={"content-range": f"bytes */{stat_result.st_size}", "cache-control": headers["cache-control"]},
+            )
+        if byte_range is None:
+            return response
+        start, end = byte_range
+        range_headers = {**headers, "content-range": f"bytes {start}-{end}/{stat_result.st_size}"}
+        return RangeFileResponse(full_path, start, end, headers=range_headers, stat_result=stat_result)
@@ -1,19 +1,42 @@
 import os
-from pathlib import Path
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
 from starlette.middleware.sessions import SessionMiddleware
 from fastapi.middleware.cors import CORSMiddleware
 from .routers.user_routes import router as user_router
 from .routers.post_routes import router as post_router
 from .routers.comment_routes import router as comment_router
 from .routers.like_routes import router as like_router
+from .routers.system_routes import router as system_router
+from . import utils
+from .image_files import ImageFiles
+from .services import summary_service, image_service
+from .services.summary_jobs import summary_jobs
+from .services.view_counter import view_counter
 from dotenv import load_dotenv
 
 load_dotenv()
 SECRET_KEY = os.getenv("SESSION_SECRET_KEY")
 
-app = FastAPI(title="Community API")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    summary_service.batcher.start()
+    if summary_service.PRELOAD_MODEL:
+        summary_service.start_loading()
+    view_counter.start()
+    # 재시작 전에 끝나지 않은 요약(pending) 다시 처리
+    summary_jobs.start()
+    yield
+    await view_counter.stop()
+    # 진행 중이던 요약은 pending 으로 남아 다음 시작 때 다시 처리됨
+    await summary_jobs.stop()
+    await summary_service.batcher.stop()
+    utils.shutdown_hash_executor()
+    image_service.shutdown_derivative_executor()
+
+
+app = FastAPI(title="Community API", lifespan=lifespan)
 
 origins = [
     "http://localhost:5500",   # 아래에서 띄울 프론트 서버
@@ -41,14 +64,14 @@ app.include_router(user_router)
 app.include_router(post_router)
 app.include_router(comment_router)
 app.include_router(like_router)
+app.include_router(system_router)
 
-PROJECT_ROOT = Path(__file__).resolve().parents[2]
-IMAGE_DIR = PROJECT_ROOT / "image"
+IMAGE_DIR = image_service.IMAGE_DIR
 
 IMAGE_DIR.mkdir(parents=True, exist_ok=True)
 
 app.mount(
     "/image",
-    StaticFiles(directory=IMAGE_DIR),
+    ImageFiles(directory=IMAGE_DIR),
     name="image",
 )
\ No newline at end of file
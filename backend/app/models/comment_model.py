@@ -1,6 +1,7 @@
 from sqlalchemy import select, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.entity.comment_entity import Comment
+from app.entity.user_entity import User
 
 
 async def create_comment(db: AsyncSession, post_id: int, user_id: int, content: str):
@@ -10,8 +11,8 @@ async def create_comment(db: AsyncSession, post_id: int, user_id: int, content:
         content=content,
     )
     db.add(comment)
-    await db.commit()
-    await db.refresh(comment)
+    # comment_id 만 채우고 commit 은 posts.comments_count 갱신과 함께 호출하는 쪽에서
+    await db.flush()
     return comment
 
 
@@ -29,10 +30,22 @@ async def update_comment(db: AsyncSession, comment: Comment, content: str):
 
 async def delete_comment(db: AsyncSession, comment_id: int):
     await db.execute(delete(Comment).where(Comment.comment_id == comment_id))
-    await db.commit()
     return
 
 
 async def get_comment_by_post_id(db: AsyncSession, post_id: int):
     result = await db.execute(select(Comment).where(Comment.post_id == post_id).order_by(Comment.comment_id.asc()))
     return result.scalars().all()
+
+
+async def get_comment_with_author_by_post_id(db: AsyncSession, post_id: int, cursor_id: int, count: int):
+    # keyset 페이지: (post_id, comment_id) 인덱스로 cursor 다음부터 count 개만 읽음
+    stmt = (
+        select(Comment, User.nickname, User.profile_image)
+        .join(User, User.user_id == Comment.user_id)
+        .where(Comment.post_id == post_id, Comment.comment_id > cursor_id)
+        .order_by(Comment.comment_id.asc())
+        .limit(count)
+    )
+    result = await db.execute(stmt)
+    return result.all()
@@ -9,8 +9,8 @@ async def create_like(db: AsyncSession, post_id: int, user_id: int):
         user_id=user_id,
     )
     db.add(like)
-    await db.commit()
-    await db.refresh(like)
+    # like_id 만 채우고 commit 은 posts.likes 갱신과 함께 호출하는 쪽에서
+    await db.flush()
     return like
 
 
@@ -24,7 +24,16 @@ async def get_my_like(db: AsyncSession, post_id: int, session_user_id: int):
     return result.scalars().first()
 
 
+async def get_my_likes(db: AsyncSession, post_ids: list[int], session_user_id: int) -> dict[int, int]:
+    # 목록 한 페이지의 내 좋아요를 한 번에: {post_id: like_id} (ix_likes_user_id_post_id)
+    if not post_ids:
+        return {}
+    result = await db.execute(
+        select(Like.post_id, Like.like_id).where(Like.user_id == session_user_id, Like.post_id.in_(post_ids))
+    )
+    return {post_id: like_id for post_id, like_id in result.all()}
+
+
 async def delete_like(db: AsyncSession, like_id: int):
     await db.execute(delete(Like).where(Like.like_id == like_id))
-    await db.commit()
     return
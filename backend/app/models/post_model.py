@@ -1,13 +1,16 @@
+import hashlib
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.entity.post_entity import Post
-from sqlalchemy import select, delete
+from app.entity.user_entity import User
+from sqlalchemy import select, delete, update, func, case
 
-async def create_post(db: AsyncSession, user_id, title, content, summary, image_url, nickname):
+async def create_post(db: AsyncSession, user_id, title, content, summary, image_url, nickname, summary_status="done"):
     post = Post(
         user_id=user_id,
         title=title,
         content=content,
         summary=summary,
+        summary_status=summary_status,
         image_url=image_url,
         author_nickname=nickname,
         views=0,
@@ -24,14 +27,51 @@ async def get_post_by_id(db: AsyncSession, post_id: int):
     return result.scalars().first()
 
 
-async def get_post_list_by_id(db: AsyncSession, cursor_id: int):
-    result = await db.execute(select(Post).where(Post.post_id > cursor_id).order_by(Post.post_id.asc()))
-    return result.scalars().all()
+async def get_post_with_author(db: AsyncSession, post_id: int):
+    stmt = (
+        select(Post, User.nickname, User.profile_image)
+        .join(User, User.user_id == Post.user_id)
+        .where(Post.post_id == post_id)
+    )
+    result = await db.execute(stmt)
+    return result.first()
+
+
+POST_LIST_COLUMNS = (
+    Post.post_id,
+    Post.title,
+    Post.summary,
+    Post.summary_status,
+    Post.created_at,
+    Post.updated_at,
+    Post.views,
+    Post.comments_count,
+    Post.likes,
+    User.nickname.label("author_nickname"),
+    User.profile_image.label("author_profile_image"),
+)
+
 
-async def update_post(db: AsyncSession, post, title, content, summary, image_url: str | None):
+async def get_post_list_by_id(db: AsyncSession, cursor_id: int, count: int, order: str = "asc"):
+    # post_id(PK) 기준 keyset pagination: 페이지 비용이 테이블 크기와 무관하게 O(count)
+    # 작성자 정보는 join 으로 같이 가져와서 게시글마다 users 조회를 하지 않음
+    # 목록에 필요한 컬럼만 읽음 (content TEXT 제외), ORM 객체 대신 이름으로 접근하는 Row 반환
+    stmt = select(*POST_LIST_COLUMNS).join(User, User.user_id == Post.user_id)
+    if order == "desc":
+        if cursor_id > 0:
+            stmt = stmt.where(Post.post_id < cursor_id)
+        stmt = stmt.order_by(Post.post_id.desc())
+    else:
+        stmt = stmt.where(Post.post_id > cursor_id).order_by(Post.post_id.asc())
+    result = await db.execute(stmt.limit(count))
+    return result.all()
+
+async def update_post(db: AsyncSession, post, title, content, summary, image_url: str | None, summary_status="done", summarizer=None):
     post.title = title
     post.content = content
     post.summary = summary
+    post.summary_status = summary_status
+    post.summarizer = summarizer
     post.image_url = image_url
     await db.commit()
     await db.refresh(post)
@@ -42,26 +82,103 @@ async def delete_post(db: AsyncSession, post_id:int):
     await db.commit()
     return
 
-async def update_views(db: AsyncSession, post):
-    post.views = (post.views or 0) + 1
-    if post.views < 0:
-        post.views = 0
+async def get_post_summary(db: AsyncSession, post_id: int):
+    result = await db.execute(
+        select(Post.summary, Post.summary_status, Post.summarizer).where(Post.post_id == post_id)
+    )
+    return result.first()
+
+async def get_post_summaries(db: AsyncSession, post_ids: list[int]):
+    result = await db.execute(
+        select(Post.post_id, Post.summary, Post.summary_status, Post.summarizer).where(Post.post_id.in_(post_ids))
+    )
+    return result.all()
+
+async def get_pending_summary_posts(db: AsyncSession, cursor_id: int, count: int):
+    # 요약 대기 게시글을 post_id 순서로 count 개씩 (ix_posts_summary_status)
+    result = await db.execute(
+        select(Post.post_id, Post.content)
+        .where(Post.summary_status == "pending", Post.post_id > cursor_id)
+        .order_by(Post.post_id.asc())
+        .limit(count)
+    )
+    return result.all()
+
+def content_hash(content: str) -> str:
+    # MySQL MD5(content) 와 같은 값 (utf8mb4 본문)
+    return hashlib.md5(content.encode("utf-8")).hexdigest()
+
+async def set_summary(db: AsyncSession, post_id: int, content: str, summary: str | None, summary_status: str, summarizer: str | None) -> bool:
+    # 요약한 본문이 지금 본문과 같을 때만 저장 (늦게 끝난 이전 수정본의 요약이 새 요약을 덮어쓰지 않도록)
+    result = await db.execute(
+        update(Post)
+        .where(Post.post_id == post_id, func.md5(Post.content) == content_hash(content))
+        .values(summary=summary, summary_status=summary_status, summarizer=summarizer)
+        .execution_options(synchronize_session=False)
+    )
     await db.commit()
-    await db.refresh(post)
-    return post
+    return result.rowcount > 0
+
+async def get_posts_for_resummary(db: AsyncSession, cursor_id: int, count: int, only: str = "all"):
+    # 재요약 CLI: post_id 순서로 count 개씩 (only: all / extractive / failed)
+    # content_hash 는 쓰기 직전 본문이 그대로인지 확인하는 용도 (set_summaries)
+    stmt = select(Post.post_id, Post.content, func.md5(Post.content).label("content_hash")).where(
+        Post.post_id > cursor_id, Post.summary_status != "pending"
+    )
+    if only == "extractive":
+        stmt = stmt.where(Post.summarizer == "extractive")
+    elif only == "failed":
+        stmt = stmt.where(Post.summary_status == "failed")
+    result = await db.execute(stmt.order_by(Post.post_id.asc()).limit(count))
+    return result.all()
 
-async def update_likes(db: AsyncSession, post, count):
-    post.likes = (post.likes or 0) + count
-    if post.likes < 0:
-        post.likes = 0
+async def set_summaries(db: AsyncSession, summaries: dict[int, tuple[str, str]], content_hashes: dict[int, str]) -> int:
+    # {post_id: (summary, summarizer)} 를 CASE 문 UPDATE 한 번으로 반영, 실제로 반영된 행 수 반환
+    # 읽은 뒤 수정된 글(본문 해시가 다름)이나 다시 요약 대기 중(pending)인 글은 건너뜀
+    # 요약만 바뀌므로 updated_at 은 유지
+    result = await db.execute(
+        update(Post)
+        .where(
+            Post.post_id.in_(list(summaries)),
+            Post.summary_status != "pending",
+            func.md5(Post.content) == case(content_hashes, value=Post.post_id),
+        )
+        .values(
+            summary=case({post_id: summary for post_id, (summary, _) in summaries.items()}, value=Post.post_id),
+            summarizer=case({post_id: summarizer for post_id, (_, summarizer) in summaries.items()}, value=Post.post_id),
+            summary_status="done",
+            updated_at=Post.updated_at,
+        )
+        .execution_options(synchronize_session=False)
+    )
     await db.commit()
-    await db.refresh(post)
-    return post
+    return result.rowcount
 
-async def update_comments_count(db: AsyncSession, post, count):
-    post.comments_count = (post.comments_count or 0) + count
-    if post.comments_count < 0:
-        post.comments_count = 0
+async def add_views(db: AsyncSession, views: dict[int, int]):
+    # {post_id: 증가분} 을 CASE 문 하나로 반영
+    increment = case(views, value=Post.post_id, else_=0)
+    await db.execute(
+        update(Post)
+        .where(Post.post_id.in_(list(views)))
+        .values(views=Post.views + increment)
+        .execution_options(synchronize_session=False)
+    )
     await db.commit()
-    await db.refresh(post)
-    return post
\ No newline at end of file
+
+# 카운터는 DB 안에서 원자적으로 증감 (동시 요청에서도 유실 없음)
+# commit 은 likes / comments 행 추가·삭제와 같은 트랜잭션으로 호출하는 쪽에서 한 번만
+async def update_likes(db: AsyncSession, post_id: int, count: int):
+    await db.execute(
+        update(Post)
+        .where(Post.post_id == post_id)
+        .values(likes=func.greatest(Post.likes + count, 0))
+        .execution_options(synchronize_session=False)
+    )
+
+async def update_comments_count(db: AsyncSession, post_id: int, count: int):
+    await db.execute(
+        update(Post)
+        .where(Post.post_id == post_id)
+        .values(comments_count=func.greatest(Post.comments_count + count, 0))
+        .execution_options(synchronize_session=False)
+    )
@@ -0,0 +1,16 @@
+from sqlalchemy import select
+from sqlalchemy.dialects.mysql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.entity.summary_cache_entity import SummaryCache
+
+
+async def get_summary(db: AsyncSession, cache_key: str):
+    result = await db.execute(select(SummaryCache.summary).where(SummaryCache.cache_key == cache_key))
+    return result.scalars().first()
+
+
+async def save_summary(db: AsyncSession, cache_key: str, summary: str):
+    stmt = insert(SummaryCache).values(cache_key=cache_key, summary=summary)
+    stmt = stmt.on_duplicate_key_update(summary=stmt.inserted.summary)
+    await db.execute(stmt)
+    await db.commit()
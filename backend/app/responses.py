@@ -0,0 +1,101 @@
+import os
+import gzip
+import json
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from fastapi import Request
+from fastapi.responses import Response, JSONResponse as StarletteJSONResponse
+from dotenv import load_dotenv
+
+try:
+    import orjson
+except ImportError:  # orjson 이 없으면 표준 json 으로
+    orjson = None
+
+try:
+    import brotli
+except ImportError:  # brotli 는 선택 설치, 없으면 gzip 만 사용
+    brotli = None
+
+load_dotenv()
+
+COMPRESS_MIN_BYTES = int(os.getenv("RESPONSE_COMPRESS_MIN_BYTES", "1024"))
+GZIP_LEVEL = 5
+BROTLI_QUALITY = 4
+
+
+def render_json(content) -> bytes:
+    # starlette JSONResponse.render 와 같은 형식 (공백 없음, UTF-8 그대로), orjson 이 있으면 orjson 으로
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def precomputed(value):
+    # 캐시에 오래 두고 여러 응답에 들어가는 값(댓글 목록 등)은 미리 직렬화해 둠
+    # orjson.Fragment 는 다시 직렬화하지 않고 bytes 를 그대로 끼워 넣음 (orjson 3.9+)
+    if orjson is not None and hasattr(orjson, "Fragment"):
+        return orjson.Fragment(orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS))
+    return value
+
+
+class JSONResponse(StarletteJSONResponse):
+    # 컨트롤러 공용 응답: fastapi.responses.JSONResponse 와 같은 사용법, 직렬화만 render_json 으로
+    def render(self, content) -> bytes:
+        return render_json(content)
+
+
+def make_etag(body: bytes) -> str:
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # gzip 등으로 서버/프록시가 붙인 W/ 접두사는 무시하고 비교
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return etag in candidates
+
+
+def choose_encoding(accept_encoding: str) -> str | None:
+    accepted = {item.split(";")[0].strip().lower() for item in accept_encoding.split(",")}
+    if brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return None
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL)
+
+
+def conditional_json_response(request: Request, content, last_modified: datetime | None = None, etag_content=None, status_code: int = 200) -> Response:
+    # ETag 는 응답 본문 해시 -> updated_at, 좋아요/댓글 수, 사용자별 값이 바뀌면 ETag 도 바뀜
+    # etag_content 를 주면 본문 대신 그 값으로 ETag 계산 (매 요청마다 바뀌는 값을 빼고 싶을 때)
+    body = render_json(content)
+    etag = make_etag(body if etag_content is None else render_json(etag_content))
+    headers = {
+        "etag": etag,
+        # 매번 재검증 (변경 없으면 304), 사용자별 값이 있어 공유 캐시에는 저장하지 않음
+        "cache-control": "private, no-cache",
+        "vary": "Accept-Encoding, Cookie",
+    }
+    if last_modified is not None:
+        headers["last-modified"] = format_datetime(last_modified.replace(tzinfo=timezone.utc), usegmt=True)
+
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    if len(body) >= COMPRESS_MIN_BYTES:
+        encoding = choose_encoding(request.headers.get("accept-encoding", ""))
+        if encoding is not None:
+            body = compress(body, encoding)
+            headers["content-encoding"] = encoding
+
+    return Response(content=body, status_code=status_code, media_type="application/json", headers=headers)
@@ -6,13 +6,17 @@ from app.db import get_db
 router = APIRouter()
 
 @router.get("/posts")
-async def list_posts(cursor_id: int, count: int, db: AsyncSession = Depends(get_db)):
-    return await pc.list_posts(cursor_id, count, db)
+async def list_posts(request: Request, cursor_id: int = 0, count: int = 10, order: str = "asc", cursor: str | None = None, db: AsyncSession = Depends(get_db)):
+    return await pc.list_posts(cursor_id, count, order, cursor, request, db)
 
 @router.post("/posts")
 async def create_post(request: Request, db: AsyncSession = Depends(get_db)):
     return await pc.create_post(request, db)
 
+@router.get("/posts/summaries/stream")
+async def stream_post_summaries(request: Request, post_ids: str):
+    return await pc.stream_post_summaries(post_ids, request)
+
 @router.put("/posts/{post_id}")
 async def update_post(post_id: int, request: Request, db: AsyncSession = Depends(get_db)):
     return await pc.update_post(post_id, request, db)
@@ -21,6 +25,18 @@ async def update_post(post_id: int, request: Request, db: AsyncSession = Depends
 async def get_post_detail(post_id: int, request: Request, db: AsyncSession = Depends(get_db)):
     return await pc.get_post_detail(post_id, request, db)
 
+@router.get("/posts/{post_id}/comments")
+async def list_comments(post_id: int, request: Request, cursor_id: int = 0, count: int | None = None, db: AsyncSession = Depends(get_db)):
+    return await pc.list_comments(post_id, cursor_id, count, request, db)
+
+@router.get("/posts/{post_id}/summary")
+async def get_post_summary(post_id: int, request: Request, db: AsyncSession = Depends(get_db)):
+    return await pc.get_post_summary(post_id, request, db)
+
+@router.get("/posts/{post_id}/summary/stream")
+async def stream_post_summary(post_id: int, request: Request):
+    return await pc.stream_post_summary(post_id, request)
+
 @router.delete("/posts/{post_id}")
 async def delete_post(post_id: int, request: Request, db: AsyncSession = Depends(get_db)):
     return await pc.delete_post(post_id, request, db)
@@ -0,0 +1,20 @@
+from fastapi import APIRouter
+from ..controllers import system_controller as sc
+
+router = APIRouter()
+
+@router.get("/system/ready")
+async def get_readiness():
+    return await sc.get_readiness()
+
+@router.get("/system/summary-cache")
+async def get_summary_cache_stats():
+    return await sc.get_summary_cache_stats()
+
+@router.get("/system/response-cache")
+async def get_response_cache_stats():
+    return await sc.get_response_cache_stats()
+
+@router.get("/system/db-pool")
+async def get_db_pool_stats():
+    return await sc.get_db_pool_stats()
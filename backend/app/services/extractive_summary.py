@@ -0,0 +1,62 @@
+import re
+import math
+from collections import Counter
+
+# 모델 없이 본문 문장 중 일부를 골라 요약 (짧은 글 / 요약 큐가 밀릴 때 KoBART 대신 사용)
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?。])\s+|\n+")
+WORD = re.compile(r"\w+")
+MAX_SENTENCES = 3
+FIRST_SENTENCE_BOOST = 1.2  # 첫 문장에 주제가 오는 경우가 많음
+
+
+def split_sentences(content: str) -> list[str]:
+    return [sentence.strip() for sentence in SENTENCE_BOUNDARY.split(content) if sentence.strip()]
+
+
+def _terms(sentence: str) -> list[str]:
+    # 한국어는 조사/어미 때문에 어절이 그대로 겹치는 일이 적어서 어절 안의 글자 bigram 을 단위로 씀
+    terms = []
+    for word in WORD.findall(sentence.lower()):
+        if len(word) == 1:
+            terms.append(word)
+        terms.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return terms
+
+
+def summarize(content: str, max_chars: int) -> str:
+    sentences = split_sentences(content)
+    joined = " ".join(sentences)
+    # 이미 충분히 짧으면 본문 그대로
+    if len(joined) <= max_chars or len(sentences) <= 1:
+        return joined
+
+    # 문장별 TF-IDF 평균 점수 (문장 = 문서)
+    term_lists = [_terms(sentence) for sentence in sentences]
+    document_frequency = Counter()
+    for terms in term_lists:
+        document_frequency.update(set(terms))
+    total = len(sentences)
+    scores = []
+    for index, terms in enumerate(term_lists):
+        if not terms:
+            scores.append(0.0)
+            continue
+        weight = sum(count * math.log(1 + total / document_frequency[term]) for term, count in Counter(terms).items())
+        score = weight / len(terms)
+        scores.append(score * FIRST_SENTENCE_BOOST if index == 0 else score)
+
+    # 점수 순으로 max_chars 안에 들어가는 문장을 고른 뒤 본문 순서대로 이어 붙임
+    chosen = []
+    length = 0
+    for index in sorted(range(total), key=lambda i: scores[i], reverse=True):
+        sentence_length = len(sentences[index]) + (1 if chosen else 0)
+        if length + sentence_length > max_chars:
+            continue
+        chosen.append(index)
+        length += sentence_length
+        if len(chosen) >= MAX_SENTENCES:
+            break
+    if not chosen:
+        # 어떤 문장도 길이에 안 맞으면 가장 점수 높은 문장 (호출하는 쪽에서 길이에 맞게 자름)
+        return sentences[max(range(total), key=lambda i: scores[i])]
+    return " ".join(sentences[index] for index in sorted(chosen))
@@ -0,0 +1,182 @@
+import os
+import uuid
+import asyncio
+import hashlib
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+import aiofiles
+import aiofiles.os
+from pathlib import Path
+from fastapi import UploadFile
+from dotenv import load_dotenv
+
+load_dotenv()
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+IMAGE_DIR = PROJECT_ROOT / "image"
+IMAGE_BASE_URL = os.getenv("IMAGE_BASE_URL", "http://localhost:8000")
+IMAGE_MAX_BYTES = int(os.getenv("IMAGE_MAX_BYTES", str(10 * 1024 * 1024)))
+CHUNK_SIZE = 1024 * 1024  # 1MB씩
+IMAGE_DERIVATIVE_WORKERS = int(os.getenv("IMAGE_DERIVATIVE_WORKERS", "2"))
+
+# 변형 이름: 긴 변 최대 픽셀 (WebP 로 재압축해서 원본 옆에 <stem>_<variant>.webp 로 저장)
+IMAGE_VARIANTS = {
+    "thumb": 640,   # 게시글 이미지 미리보기
+    "avatar": 96,   # 작성자 프로필 (목록/댓글에서 40px 로 표시)
+}
+WEBP_QUALITY = 80
+
+
+class InvalidImageError(Exception):
+    pass
+
+
+class ImageTooLargeError(Exception):
+    pass
+
+
+def sniff_image_extension(head: bytes) -> str | None:
+    # content_type / 파일 이름 대신 실제 바이트로 형식 판단
+    if head.startswith(b"\xff\xd8\xff"):
+        return ".jpg"
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return ".png"
+    if head[:6] in (b"GIF87a", b"GIF89a"):
+        return ".gif"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return ".webp"
+    return None
+
+
+def public_url(file_name: str) -> str:
+    return f"{IMAGE_BASE_URL}/image/{file_name}"
+
+
+async def _hash_upload(file: UploadFile):
+    # 1차: 쓰기 없이 읽기만 하면서 형식 확인 + 크기 제한 + sha256
+    digest = hashlib.sha256()
+    size = 0
+    ext = None
+    while True:
+        chunk = await file.read(CHUNK_SIZE)
+        if not chunk:
+            break
+        if ext is None:
+            ext = sniff_image_extension(chunk[:16])
+            if ext is None:
+                raise InvalidImageError()
+        size += len(chunk)
+        if size > IMAGE_MAX_BYTES:
+            raise ImageTooLargeError()
+        digest.update(chunk)
+    if ext is None:
+        raise InvalidImageError()
+    return digest.hexdigest(), ext
+
+
+async def save_upload(file: UploadFile) -> str:
+    if file.size is not None and file.size > IMAGE_MAX_BYTES:
+        raise ImageTooLargeError()
+
+    content_hash, ext = await _hash_upload(file)
+    file_name = f"{content_hash}{ext}"
+    save_path = IMAGE_DIR / file_name
+
+    # 같은 이미지가 이미 있으면 다시 쓰지 않고 기존 파일 사용
+    if await aiofiles.os.path.exists(save_path):
+        return file_name
+
+    # 2차: 임시 파일에 이벤트 루프를 막지 않고 쓴 뒤 rename (다른 요청이 덜 쓴 파일을 보지 않도록)
+    await file.seek(0)
+    tmp_path = IMAGE_DIR / f".{uuid.uuid4().hex}.part"
+    try:
+        async with aiofiles.open(tmp_path, "wb") as buffer:
+            while True:
+                chunk = await file.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                await buffer.write(chunk)
+        await aiofiles.os.replace(tmp_path, save_path)
+    finally:
+        if await aiofiles.os.path.exists(tmp_path):
+            await aiofiles.os.remove(tmp_path)
+    return file_name
+
+
+def variant_file_name(file_name: str, variant: str) -> str:
+    stem = os.path.splitext(file_name)[0]
+    return f"{stem}_{variant}.webp"
+
+
+def is_variant_file(file_name: str) -> bool:
+    stem = os.path.splitext(file_name)[0]
+    return any(stem.endswith(f"_{variant}") for variant in IMAGE_VARIANTS)
+
+
+def variant_url(url: str | None, variant: str) -> str | None:
+    # 변형이 만들어져 있으면 변형 URL, 아직 없거나 외부 이미지면 원본 그대로
+    if not url or "/image/" not in url:
+        return url
+    prefix, file_name = url.rsplit("/image/", 1)
+    derived = variant_file_name(file_name, variant)
+    if (IMAGE_DIR / derived).exists():
+        return f"{prefix}/image/{derived}"
+    return url
+
+
+def build_derivatives(file_name: str) -> list[str]:
+    # 프로세스 풀에서 실행 (Pillow 는 이미지 처리 작업자에서만 import)
+    from PIL import Image, ImageOps
+
+    created = []
+    source = IMAGE_DIR / file_name
+    with Image.open(source) as original:
+        image = ImageOps.exif_transpose(original)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "transparency" in image.info or "A" in image.getbands() else "RGB")
+        for variant, max_side in IMAGE_VARIANTS.items():
+            target = IMAGE_DIR / variant_file_name(file_name, variant)
+            if target.exists():
+                continue
+            resized = image.copy()
+            resized.thumbnail((max_side, max_side), Image.LANCZOS)
+            tmp_path = target.with_name(f".{target.name}.part")
+            resized.save(tmp_path, "WEBP", quality=WEBP_QUALITY, method=4)
+            os.replace(tmp_path, target)
+            created.append(target.name)
+    return created
+
+
+_derivative_executor = None
+_derivative_jobs: set = set()
+
+
+def _get_derivative_executor():
+    global _derivative_executor
+    if _derivative_executor is None:
+        _derivative_executor = ProcessPoolExecutor(max_workers=IMAGE_DERIVATIVE_WORKERS)
+    return _derivative_executor
+
+
+def _on_derivatives_done(future):
+    _derivative_jobs.discard(future)
+    if future.cancelled():
+        return
+    error = future.exception()
+    if error is not None:
+        print("[image-derivatives] failed:", repr(error))
+        traceback.print_exception(error)
+
+
+def schedule_derivatives(file_name: str):
+    # 업로드 응답은 기다리지 않고 백그라운드에서 변형 생성
+    future = asyncio.get_running_loop().run_in_executor(_get_derivative_executor(), build_derivatives, file_name)
+    _derivative_jobs.add(future)
+    future.add_done_callback(_on_derivatives_done)
+
+
+def shutdown_derivative_executor():
+    global _derivative_executor
+    if _derivative_executor is not None:
+        _derivative_executor.shutdown(wait=True, cancel_futures=True)
+        _derivative_executor = None
@@ -0,0 +1,134 @@
+import os
+import time
+from collections import OrderedDict
+from dotenv import load_dotenv
+
+load_dotenv()
+
+CACHE_TTL_SECONDS = float(os.getenv("RESPONSE_CACHE_TTL_SECONDS", "10"))
+CACHE_MAX_SIZE = int(os.getenv("RESPONSE_CACHE_MAX_SIZE", "1024"))
+
+
+class ResponseCache:
+    # 프로세스 단위 캐시: 다른 워커의 쓰기는 TTL 이 지나야 반영됨
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.entries: OrderedDict = OrderedDict()
+        self.tags: dict[str, set] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, value, _ = entry
+        if expires_at < time.monotonic():
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key, value, tags=()):
+        if key in self.entries:
+            self._remove(key)
+        self.entries[key] = (time.monotonic() + self.ttl, value, tuple(tags))
+        for tag in tags:
+            self.tags.setdefault(tag, set()).add(key)
+        while len(self.entries) > self.max_size:
+            oldest = next(iter(self.entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def invalidate(self, key):
+        if key in self.entries:
+            self._remove(key)
+            self.invalidations += 1
+
+    def invalidate_tag(self, tag):
+        for key in list(self.tags.get(tag, ())):
+            self.invalidate(key)
+
+    def clear(self):
+        self.invalidations += len(self.entries)
+        self.entries.clear()
+        self.tags.clear()
+
+    def _remove(self, key):
+        _, _, tags = self.entries.pop(key)
+        for tag in tags:
+            keys = self.tags.get(tag)
+            if keys is None:
+                continue
+            keys.discard(key)
+            if not keys:
+                del self.tags[tag]
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self.entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+# GET /posts 페이지: key = (cursor_id, count, order)
+post_list_cache = ResponseCache(CACHE_MAX_SIZE, CACHE_TTL_SECONDS)
+# GET /posts/{post_id}: 사용자별 값(is_liked_by_me, like_id)과 아직 반영 안 된 조회수는 빼고 저장
+post_detail_cache = ResponseCache(CACHE_MAX_SIZE, CACHE_TTL_SECONDS)
+# GET /posts/{post_id}/comments 페이지: key = (post_id, cursor_id, count), tag = post:{post_id}
+comment_page_cache = ResponseCache(CACHE_MAX_SIZE, CACHE_TTL_SECONDS)
+
+
+def post_tag(post_id: int) -> str:
+    return f"post:{post_id}"
+
+
+def list_page_tags(post_ids, cursor_id: int, order: str, has_more: bool):
+    tags = [post_tag(post_id) for post_id in post_ids]
+    # 새 글은 오래된 순의 마지막 페이지, 최신 순의 첫 페이지에만 영향을 줌
+    if order == "asc" and not has_more:
+        tags.append("list:tail")
+    if order == "desc" and cursor_id == 0:
+        tags.append("list:head")
+    return tags
+
+
+def invalidate_post(post_id: int):
+    post_detail_cache.invalidate(post_id)
+    post_list_cache.invalidate_tag(post_tag(post_id))
+    comment_page_cache.invalidate_tag(post_tag(post_id))
+
+
+def invalidate_new_post():
+    post_list_cache.invalidate_tag("list:tail")
+    post_list_cache.invalidate_tag("list:head")
+
+
+def invalidate_all():
+    post_list_cache.clear()
+    post_detail_cache.clear()
+    comment_page_cache.clear()
+
+
+def stats() -> dict:
+    return {
+        "post_list": post_list_cache.stats(),
+        "post_detail": post_detail_cache.stats(),
+        "comment_page": comment_page_cache.stats(),
+    }
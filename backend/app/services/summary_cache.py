@@ -0,0 +1,85 @@
+import os
+import json
+import hashlib
+import traceback
+from collections import OrderedDict
+from dotenv import load_dotenv
+from ..db import AsyncSessionLocal
+from ..models import summary_cache_model
+
+load_dotenv()
+
+CACHE_MAX_SIZE = int(os.getenv("SUMMARY_CACHE_MAX_SIZE", "2048"))
+CACHE_PERSIST = os.getenv("SUMMARY_CACHE_PERSIST", "0") == "1"
+
+
+def make_key(content: str, model_id: str, params: dict) -> str:
+    # 공백 차이만 있는 본문은 같은 요약을 쓰도록 정규화
+    normalized = " ".join(content.split())
+    raw = "\0".join([model_id, json.dumps(params, sort_keys=True), normalized])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class SummaryCache:
+    def __init__(self, max_size: int, persist: bool):
+        self.max_size = max_size
+        self.persist = persist
+        self.entries: OrderedDict[str, str] = OrderedDict()
+        self.memory_hits = 0
+        self.persistent_hits = 0
+        self.misses = 0
+
+    def _remember(self, key: str, summary: str):
+        self.entries[key] = summary
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    async def get(self, key: str) -> str | None:
+        summary = self.entries.get(key)
+        if summary is not None:
+            self.entries.move_to_end(key)
+            self.memory_hits += 1
+            return summary
+
+        if self.persist:
+            try:
+                async with AsyncSessionLocal() as db:
+                    summary = await summary_cache_model.get_summary(db, key)
+            except Exception as e:
+                print("[summary-cache] read failed:", repr(e))
+                summary = None
+            if summary is not None:
+                self._remember(key, summary)
+                self.persistent_hits += 1
+                return summary
+
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, summary: str):
+        self._remember(key, summary)
+        if not self.persist:
+            return
+        try:
+            async with AsyncSessionLocal() as db:
+                await summary_cache_model.save_summary(db, key, summary)
+        except Exception as e:
+            print("[summary-cache] write failed:", repr(e))
+            traceback.print_exc()
+
+    def stats(self) -> dict:
+        hits = self.memory_hits + self.persistent_hits
+        lookups = hits + self.misses
+        return {
+            "size": len(self.entries),
+            "max_size": self.max_size,
+            "persist": self.persist,
+            "memory_hits": self.memory_hits,
+            "persistent_hits": self.persistent_hits,
+            "misses": self.misses,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+summary_cache = SummaryCache(CACHE_MAX_SIZE, CACHE_PERSIST)
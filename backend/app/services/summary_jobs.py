@@ -0,0 +1,129 @@
+import os
+import asyncio
+import traceback
+from dotenv import load_dotenv
+from ..db import AsyncSessionLocal
+from ..models import post_model
+from . import summary_service, response_cache
+
+load_dotenv()
+
+# 동시에 요약을 기다리는 게시글 수 (나머지는 여기서 대기, 실제 generate 배치는 summary_service 가 묶음)
+JOB_CONCURRENCY = int(os.getenv("SUMMARY_JOB_CONCURRENCY", "32"))
+REQUEUE_PAGE_SIZE = 100
+
+
+class SummaryJobs:
+    def __init__(self, concurrency: int):
+        self.concurrency = max(1, concurrency)
+        self.semaphore: asyncio.Semaphore | None = None
+        self.jobs: dict[int, asyncio.Task] = {}
+        self.listeners: dict[int, set[asyncio.Event]] = {}
+        self.requeue_task: asyncio.Task | None = None
+
+    def submit(self, post_id: int, content: str):
+        if self.semaphore is None:
+            self.semaphore = asyncio.Semaphore(self.concurrency)
+        # 요약 중에 본문이 다시 수정되면 이전 작업은 버리고 새 본문으로
+        previous = self.jobs.get(post_id)
+        if previous is not None and not previous.done():
+            previous.cancel()
+        task = asyncio.create_task(self._run(post_id, content))
+        self.jobs[post_id] = task
+        task.add_done_callback(lambda done: self._on_done(post_id, done))
+
+    def _on_done(self, post_id: int, task: asyncio.Task):
+        if self.jobs.get(post_id) is task:
+            del self.jobs[post_id]
+
+    def pending(self) -> int:
+        return len(self.jobs)
+
+    async def _run(self, post_id: int, content: str):
+        async with self.semaphore:
+            try:
+                # 모델이 준비되지 않았거나 대기열이 밀려 있으면 추출 요약 (summarizer 로 구분)
+                summary, summarizer = await summary_service.summarize(content)
+                status = "done"
+            except asyncio.CancelledError:
+                # 서버 종료 / 재수정: pending 그대로 두고 다음 시작 때 또는 새 작업이 처리
+                raise
+            except Exception as e:
+                print("[summary-job] failed:", post_id, repr(e))
+                traceback.print_exc()
+                summary, summarizer, status = None, None, "failed"
+
+            try:
+                async with AsyncSessionLocal() as db:
+                    saved = await post_model.set_summary(db, post_id, content, summary, status, summarizer)
+            except Exception as e:
+                # 저장 실패 시 pending 으로 남아 다음 시작 때 다시 처리
+                print("[summary-job] save failed:", post_id, repr(e))
+                traceback.print_exc()
+                return
+            if not saved:
+                # 그사이 본문이 수정됨 (또는 삭제됨): 새 본문의 요약 작업이 저장 / 알림
+                print("[summary-job] content changed, dropped stale summary:", post_id)
+                return
+            response_cache.invalidate_post(post_id)
+            self._notify(post_id)
+
+    async def wait_for_update(self, post_ids: list[int], timeout: float) -> bool:
+        # 이 워커에서 post_ids 중 하나라도 요약이 끝나면 바로 깨어남, 다른 워커가 처리하는 경우를 위해 timeout 마다 DB 재확인
+        event = asyncio.Event()
+        for post_id in post_ids:
+            self.listeners.setdefault(post_id, set()).add(event)
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            for post_id in post_ids:
+                listeners = self.listeners.get(post_id)
+                if listeners is not None:
+                    listeners.discard(event)
+                    if not listeners:
+                        del self.listeners[post_id]
+
+    def _notify(self, post_id: int):
+        for event in self.listeners.get(post_id, ()):
+            event.set()
+
+    async def requeue_pending(self):
+        # 재시작 전에 끝나지 못한 pending 게시글을 다시 작업으로
+        cursor_id = 0
+        requeued = 0
+        try:
+            while True:
+                async with AsyncSessionLocal() as db:
+                    rows = await post_model.get_pending_summary_posts(db, cursor_id, REQUEUE_PAGE_SIZE)
+                if not rows:
+                    break
+                for post_id, content in rows:
+                    if post_id not in self.jobs:
+                        self.submit(post_id, content)
+                        requeued += 1
+                cursor_id = rows[-1].post_id
+        except Exception as e:
+            print("[summary-job] requeue failed:", repr(e))
+            traceback.print_exc()
+        if requeued:
+            print("[summary-job] requeued pending posts:", requeued)
+
+    def start(self):
+        if self.requeue_task is None or self.requeue_task.done():
+            self.requeue_task = asyncio.create_task(self.requeue_pending())
+
+    async def stop(self):
+        tasks = list(self.jobs.values())
+        if self.requeue_task is not None:
+            tasks.append(self.requeue_task)
+            self.requeue_task = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self.jobs.clear()
+
+
+summary_jobs = SummaryJobs(JOB_CONCURRENCY)
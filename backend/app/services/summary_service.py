@@ -0,0 +1,367 @@
+import os
+import asyncio
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from dotenv import load_dotenv
+from .summary_cache import summary_cache, make_key
+from . import extractive_summary
+from .extractive_summary import SENTENCE_BOUNDARY
+from ..entity.post_entity import Post
+
+load_dotenv()
+
+MODEL_PATH = os.getenv("SUMMARY_MODEL_PATH", "./ai/kobart-summary-v3")
+MAX_BATCH_SIZE = int(os.getenv("SUMMARY_MAX_BATCH_SIZE", "8"))
+MAX_WAIT_MS = int(os.getenv("SUMMARY_MAX_WAIT_MS", "20"))
+
+# 추론 프로필: quantize = Linear 층 동적 int8 양자화 (CPU), generation = model.generate 인자
+INFERENCE_PROFILES = {
+    # 기존 동작: fp32, 모델 config 의 beam 설정
+    "fp32": {"quantize": False, "generation": {"max_length": 200}},
+    "int8": {"quantize": True, "generation": {"max_length": 200}},
+    "int8-beam": {"quantize": True, "generation": {"num_beams": 3, "max_new_tokens": 128, "length_penalty": 1.0}},
+    "int8-greedy": {"quantize": True, "generation": {"num_beams": 1, "do_sample": False, "max_new_tokens": 128}},
+}
+INFERENCE_PROFILE = os.getenv("SUMMARY_PROFILE", "fp32")
+if INFERENCE_PROFILE not in INFERENCE_PROFILES:
+    raise ValueError(f"unknown SUMMARY_PROFILE: {INFERENCE_PROFILE}")
+# torch intra-op 스레드 수 (0 이면 torch 기본값 = 물리 코어 수)
+TORCH_THREADS = int(os.getenv("SUMMARY_TORCH_THREADS", "0"))
+
+
+def generation_params(profile: str) -> dict:
+    # 프로필 값 위에 환경 변수로 개별 항목 덮어쓰기
+    params = dict(INFERENCE_PROFILES[profile]["generation"])
+    if os.getenv("SUMMARY_NUM_BEAMS"):
+        params["num_beams"] = int(os.getenv("SUMMARY_NUM_BEAMS"))
+    if os.getenv("SUMMARY_MAX_NEW_TOKENS"):
+        params.pop("max_length", None)
+        params["max_new_tokens"] = int(os.getenv("SUMMARY_MAX_NEW_TOKENS"))
+    if os.getenv("SUMMARY_LENGTH_PENALTY"):
+        params["length_penalty"] = float(os.getenv("SUMMARY_LENGTH_PENALTY"))
+    return params
+
+
+QUANTIZE = INFERENCE_PROFILES[INFERENCE_PROFILE]["quantize"]
+GENERATION_PARAMS = generation_params(INFERENCE_PROFILE)
+# 긴 본문은 문장 단위로 CHUNK_TOKENS 이하 조각으로 나눠 조각별 요약 -> 요약들을 다시 요약 (map-reduce)
+CHUNK_TOKENS = int(os.getenv("SUMMARY_CHUNK_TOKENS", "512"))
+# 모델 position 한계 안쪽으로 입력 자르기 (KoBART 1026)
+MAX_INPUT_TOKENS = int(os.getenv("SUMMARY_MAX_INPUT_TOKENS", "1024"))
+MAX_REDUCE_DEPTH = 3
+# posts.summary 컬럼 길이
+SUMMARY_MAX_CHARS = Post.__table__.c.summary.type.length
+# 이 길이 이하의 본문 / 요약 대기열이 이 깊이 이상일 때는 KoBART 대신 추출 요약 (extractive_summary)
+EXTRACTIVE_MAX_CHARS = int(os.getenv("SUMMARY_EXTRACTIVE_MAX_CHARS", "300"))
+FALLBACK_QUEUE_DEPTH = int(os.getenv("SUMMARY_FALLBACK_QUEUE_DEPTH", "16"))
+# 1 이면 서버 시작 시 백그라운드로 모델을 올리고, 0 이면 첫 요약 요청 때 로딩
+PRELOAD_MODEL = os.getenv("SUMMARY_PRELOAD", "1") == "1"
+# 요약이 모델 로딩을 기다리는 최대 시간 (초과하면 추출 요약)
+MODEL_WAIT_SECONDS = float(os.getenv("SUMMARY_MODEL_WAIT_SECONDS", "30"))
+WARMUP_TEXT = "요약 모델 워밍업을 위한 문장입니다. 첫 요청이 느려지지 않도록 미리 한 번 생성해 둡니다."
+
+tokenizer = None
+model = None
+# not_loaded -> loading -> warming -> ready / failed
+model_state = "not_loaded"
+model_error: str | None = None
+# posts.summarizer 값별 요약 수
+summarizer_counts = {"kobart": 0, "extractive": 0}
+_load_future: asyncio.Future | None = None
+
+
+def load_pretrained(quantize: bool):
+    # torch / transformers import 자체가 무거워서 여기서만 import
+    import torch
+    from transformers import AutoTokenizer, AutoModelForSeq2SeqLM
+
+    if TORCH_THREADS > 0:
+        torch.set_num_threads(TORCH_THREADS)
+    loaded_tokenizer = AutoTokenizer.from_pretrained(MODEL_PATH)
+    loaded_model = AutoModelForSeq2SeqLM.from_pretrained(MODEL_PATH)
+    loaded_model.eval()
+    if quantize:
+        loaded_model = torch.quantization.quantize_dynamic(loaded_model, {torch.nn.Linear}, dtype=torch.qint8)
+    return loaded_tokenizer, loaded_model
+
+
+def load_model():
+    global tokenizer, model, model_state, model_error
+    try:
+        tokenizer, model = load_pretrained(QUANTIZE)
+
+        model_state = "warming"
+        generate_summaries([WARMUP_TEXT])
+        model_state = "ready"
+    except Exception as e:
+        model_state = "failed"
+        model_error = repr(e)
+        print("[summary-model] load failed:", repr(e))
+        traceback.print_exc()
+
+
+def start_loading():
+    global _load_future, model_state
+    if _load_future is None or (model_state == "failed" and _load_future.done()):
+        model_state = "loading"
+        # generate 와 같은 전용 스레드에서 로딩 -> 로딩이 끝나기 전에 generate 가 돌 일이 없음
+        _load_future = asyncio.get_running_loop().run_in_executor(batcher.executor, load_model)
+    return _load_future
+
+
+async def wait_until_ready(timeout: float) -> bool:
+    if model_state == "ready":
+        return True
+    try:
+        await asyncio.wait_for(asyncio.shield(start_loading()), timeout)
+    except asyncio.TimeoutError:
+        return False
+    return model_state == "ready"
+
+
+def model_status() -> dict:
+    return {
+        "model_state": model_state,
+        "model_path": MODEL_PATH,
+        "profile": INFERENCE_PROFILE,
+        "generation_params": GENERATION_PARAMS,
+        "queue_size": batcher.qsize(),
+        "summarizer_counts": summarizer_counts,
+        "error": model_error,
+    }
+
+
+def generate_summaries(texts: list[str], target_model=None, params: dict | None = None) -> list[str]:
+    # 여러 본문을 padding 해서 한 번의 generate 로 처리 (target_model / params 는 벤치마크에서 프로필 비교용)
+    target_model = model if target_model is None else target_model
+    params = GENERATION_PARAMS if params is None else params
+    inputs = tokenizer(texts, return_tensors="pt", padding=True, truncation=True, max_length=MAX_INPUT_TOKENS)
+    summary_ids = target_model.generate(**inputs, **params)
+    return tokenizer.batch_decode(summary_ids, skip_special_tokens=True)
+
+
+def split_chunks(content: str) -> list[str]:
+    # 문장 경계로 나눠서 CHUNK_TOKENS 를 넘지 않게 이어 붙임, 한 문장이 너무 길면 토큰 경계에서 자름
+    sentences = [sentence.strip() for sentence in SENTENCE_BOUNDARY.split(content) if sentence.strip()]
+    if not sentences:
+        return [content]
+    token_ids = tokenizer(sentences, add_special_tokens=False)["input_ids"]
+    if sum(len(ids) for ids in token_ids) <= CHUNK_TOKENS:
+        return [content]
+
+    chunks = []
+    current, current_tokens = [], 0
+    for sentence, ids in zip(sentences, token_ids):
+        if len(ids) > CHUNK_TOKENS:
+            if current:
+                chunks.append(" ".join(current))
+                current, current_tokens = [], 0
+            for start in range(0, len(ids), CHUNK_TOKENS):
+                chunks.append(tokenizer.decode(ids[start:start + CHUNK_TOKENS]))
+            continue
+        if current_tokens + len(ids) > CHUNK_TOKENS:
+            chunks.append(" ".join(current))
+            current, current_tokens = [], 0
+        current.append(sentence)
+        current_tokens += len(ids)
+    if current:
+        chunks.append(" ".join(current))
+    return chunks
+
+
+def clip_summary(summary: str) -> str:
+    # posts.summary 길이에 맞춤: 가능하면 마지막 문장 끝에서, 아니면 글자 단위로 자르고 "…"
+    if len(summary) <= SUMMARY_MAX_CHARS:
+        return summary
+    clipped = summary[:SUMMARY_MAX_CHARS]
+    boundaries = [match.start() for match in SENTENCE_BOUNDARY.finditer(clipped)]
+    if boundaries and boundaries[-1] >= SUMMARY_MAX_CHARS // 2:
+        return clipped[:boundaries[-1]].rstrip()
+    return clipped[:SUMMARY_MAX_CHARS - 1].rstrip() + "…"
+
+
+def summarize_texts(texts: list[str], depth: int = 0) -> list[str]:
+    # _generate 의 동기 버전 (bulk 재요약 CLI 에서 프로세스마다 모델을 올려서 사용)
+    # 짧은 본문과 긴 본문의 조각을 섞어서 MAX_BATCH_SIZE 씩 generate
+    chunk_lists = [[text] if depth >= MAX_REDUCE_DEPTH else split_chunks(text) for text in texts]
+    flat = [chunk for chunks in chunk_lists for chunk in chunks]
+    outputs = []
+    for start in range(0, len(flat), MAX_BATCH_SIZE):
+        outputs.extend(generate_summaries(flat[start:start + MAX_BATCH_SIZE]))
+
+    results = []
+    reduce_indexes, reduce_texts = [], []
+    position = 0
+    for index, chunks in enumerate(chunk_lists):
+        partials = outputs[position:position + len(chunks)]
+        position += len(chunks)
+        if len(chunks) == 1:
+            results.append(partials[0])
+        else:
+            results.append(None)
+            reduce_indexes.append(index)
+            reduce_texts.append(" ".join(partials))
+    if reduce_texts:
+        for index, summary in zip(reduce_indexes, summarize_texts(reduce_texts, depth + 1)):
+            results[index] = summary
+    return results if depth else [clip_summary(summary) for summary in results]
+
+
+class SummaryBatcher:
+    def __init__(self, max_batch_size: int, max_wait_ms: int):
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0, max_wait_ms) / 1000
+        self.queue: asyncio.Queue | None = None
+        self.worker: asyncio.Task | None = None
+        # generate 는 항상 전용 스레드 하나에서만 실행 (이벤트 루프 / 공용 threadpool 과 분리)
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="summary")
+
+    def start(self):
+        if self.worker is None or self.worker.done():
+            self.queue = asyncio.Queue()
+            self.worker = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self.worker is None:
+            return
+        self.worker.cancel()
+        try:
+            await self.worker
+        except asyncio.CancelledError:
+            pass
+        self.worker = None
+        while self.queue and not self.queue.empty():
+            _, future = self.queue.get_nowait()
+            if not future.done():
+                future.set_exception(RuntimeError("summary_service_stopped"))
+
+    def qsize(self) -> int:
+        return self.queue.qsize() if self.queue else 0
+
+    async def summarize(self, content: str) -> str:
+        self.start()
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((content, future))
+        return await future
+
+    async def _collect_batch(self):
+        loop = asyncio.get_running_loop()
+        batch = [await self.queue.get()]
+        deadline = loop.time() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect_batch()
+            texts = [content for content, _ in batch]
+            try:
+                summaries = await loop.run_in_executor(self.executor, generate_summaries, texts)
+            except asyncio.CancelledError:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(RuntimeError("summary_service_stopped"))
+                raise
+            except Exception as e:
+                print("[summary-batch] generate failed:", repr(e))
+                traceback.print_exc()
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            for (_, future), summary in zip(batch, summaries):
+                if not future.done():
+                    future.set_result(summary)
+
+
+batcher = SummaryBatcher(MAX_BATCH_SIZE, MAX_WAIT_MS)
+
+
+# 같은 본문이 동시에 들어오면 generate 는 한 번만
+_inflight: dict[str, asyncio.Future] = {}
+# 긴 본문 분할 방식 / 양자화 여부가 바뀌면 요약 결과도 달라지므로 캐시 키에 포함
+CACHE_PARAMS = {**GENERATION_PARAMS, "chunk_tokens": CHUNK_TOKENS, "quantize": QUANTIZE}
+
+
+async def _generate(content: str, depth: int = 0) -> str:
+    # 토큰화도 generate 와 같은 전용 스레드에서: fast tokenizer 는 스레드 간 공유가 안전하지 않음
+    # (generate_summaries 가 truncation / padding 설정을 바꾸는 중에 다른 스레드가 쓰면 "Already borrowed")
+    chunks = await asyncio.get_running_loop().run_in_executor(batcher.executor, split_chunks, content)
+    if len(chunks) == 1 or depth >= MAX_REDUCE_DEPTH:
+        # 짧은 본문은 기존처럼 한 번에 (깊이 제한에 걸리면 tokenizer 가 MAX_INPUT_TOKENS 로 자름)
+        return await batcher.summarize(content)
+    # map: 조각들을 한꺼번에 큐에 넣어 같은 배치로 generate
+    partials = await asyncio.gather(*(batcher.summarize(chunk) for chunk in chunks))
+    # reduce: 부분 요약을 이어 붙여 다시 요약 (아직 길면 한 번 더 나눔)
+    return await _generate(" ".join(partials), depth + 1)
+
+
+def choose_summarizer(content: str) -> str:
+    if len(content) <= EXTRACTIVE_MAX_CHARS:
+        return "extractive"
+    # 대기열이 밀려 있으면 새 요청은 모델을 기다리지 않음 (나중에 kobart 로 다시 요약 가능)
+    if batcher.qsize() >= FALLBACK_QUEUE_DEPTH:
+        return "extractive"
+    return "kobart"
+
+
+async def _extractive(content: str) -> str:
+    summary = await asyncio.get_running_loop().run_in_executor(
+        None, extractive_summary.summarize, content, SUMMARY_MAX_CHARS
+    )
+    return clip_summary(summary)
+
+
+async def summarize(content: str) -> tuple[str, str]:
+    # (요약, 요약기) 요약기는 posts.summarizer 에 저장: "kobart" / "extractive"
+    summarizer = choose_summarizer(content)
+    summary = None
+    if summarizer == "kobart":
+        summary = await _summarize_kobart(content)
+        if summary is None:
+            print("[summary] model not ready, extractive fallback:", model_state)
+            summarizer = "extractive"
+    if summary is None:
+        summary = await _extractive(content)
+    summarizer_counts[summarizer] += 1
+    return summary, summarizer
+
+
+async def _summarize_kobart(content: str) -> str | None:
+    key = make_key(content, MODEL_PATH, CACHE_PARAMS)
+    cached = await summary_cache.get(key)
+    if cached is not None:
+        return cached
+
+    if not await wait_until_ready(MODEL_WAIT_SECONDS):
+        return None
+
+    inflight = _inflight.get(key)
+    if inflight is not None:
+        return await asyncio.shield(inflight)
+
+    future = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    try:
+        summary = clip_summary(await _generate(content))
+        await summary_cache.set(key, summary)
+        future.set_result(summary)
+        return summary
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        # 기다리는 쪽이 없으면 "exception was never retrieved" 경고가 남지 않도록
+        future.exception()
+        raise
+    finally:
+        _inflight.pop(key, None)
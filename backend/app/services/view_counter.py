@@ -0,0 +1,90 @@
+import os
+import asyncio
+import traceback
+from dotenv import load_dotenv
+from ..db import AsyncSessionLocal
+from ..models import post_model
+from . import response_cache
+
+load_dotenv()
+
+FLUSH_INTERVAL_SECONDS = float(os.getenv("VIEW_FLUSH_INTERVAL_SECONDS", "5"))
+FLUSH_THRESHOLD = int(os.getenv("VIEW_FLUSH_THRESHOLD", "500"))
+
+
+class ViewCounter:
+    def __init__(self, flush_interval: float, flush_threshold: int):
+        self.flush_interval = flush_interval
+        self.flush_threshold = flush_threshold
+        self.pending_views: dict[int, int] = {}
+        self.pending_total = 0
+        self.lock = asyncio.Lock()
+        self.worker: asyncio.Task | None = None
+        self.flush_task: asyncio.Task | None = None
+        self.stopping: asyncio.Event | None = None
+
+    def increment(self, post_id: int) -> int:
+        # 조회수는 메모리에서 모아 두었다가 한 번의 UPDATE 로 반영
+        self.pending_views[post_id] = self.pending_views.get(post_id, 0) + 1
+        self.pending_total += 1
+        if self.pending_total >= self.flush_threshold and (self.flush_task is None or self.flush_task.done()):
+            self.flush_task = asyncio.create_task(self.flush())
+        return self.pending_views[post_id]
+
+    def pending(self, post_id: int) -> int:
+        return self.pending_views.get(post_id, 0)
+
+    async def flush(self):
+        async with self.lock:
+            if not self.pending_views:
+                return
+            views = self.pending_views
+            self.pending_views = {}
+            self.pending_total = 0
+            try:
+                async with AsyncSessionLocal() as db:
+                    await post_model.add_views(db, views)
+                # 캐시된 상세의 조회수 + 메모리 증가분이 어긋나지 않도록
+                for post_id in views:
+                    response_cache.post_detail_cache.invalidate(post_id)
+            except asyncio.CancelledError:
+                # UPDATE 도중 취소되면 반영됐는지 알 수 없지만 유실보다는 다시 시도 쪽을 택함
+                self._restore(views)
+                raise
+            except Exception as e:
+                print("[view-flush] unexpected error:", repr(e))
+                traceback.print_exc()
+                # 실패한 증가분은 다음 flush 때 다시 시도
+                self._restore(views)
+
+    def _restore(self, views: dict[int, int]):
+        for post_id, count in views.items():
+            self.pending_views[post_id] = self.pending_views.get(post_id, 0) + count
+            self.pending_total += count
+
+    async def _run(self):
+        # stopping 이 설정되면 진행 중인 flush 를 끝까지 마치고 종료 (cancel 하지 않음)
+        while not self.stopping.is_set():
+            try:
+                await asyncio.wait_for(self.stopping.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            await self.flush()
+
+    def start(self):
+        if self.worker is None or self.worker.done():
+            self.stopping = asyncio.Event()
+            self.worker = asyncio.create_task(self._run())
+
+    async def stop(self):
+        # 종료 시 남은 조회수 반영: 워커와 임계치 flush 가 끝나기를 기다린 뒤 마지막 flush 한 번
+        if self.worker is not None:
+            self.stopping.set()
+            await self.worker
+            self.worker = None
+        if self.flush_task is not None:
+            await self.flush_task
+            self.flush_task = None
+        await self.flush()
+
+view_counter = ViewCounter(FLUSH_INTERVAL_SECONDS, FLUSH_THRESHOLD)
@@ -1,6 +1,15 @@
+import os
 import re
+import base64
+import asyncio
+import binascii
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from dotenv import load_dotenv
+from fastapi import HTTPException
 from passlib.context import CryptContext
-from fastapi.concurrency import run_in_threadpool
+
+load_dotenv()
 
 def email_is_valid(email: str):
     pattern = r'^[\w\.-]+@[\w\.-]+\.\w+$'
@@ -20,16 +29,84 @@ def format_number(n: int) -> str:
     else:
         return str(n)
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+def format_timestamp(value: datetime | None) -> str | None:
+    # 응답의 시각 형식 통일: "YYYY-MM-DD HH:MM:SS" (strftime 보다 빠름)
+    return value.isoformat(" ", "seconds") if value else None
+
+def encode_cursor(post_id: int, order: str) -> str:
+    raw = f"{order}:{post_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+def decode_cursor(cursor: str) -> tuple[int, str]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        order, post_id = base64.urlsafe_b64decode(padded).decode("utf-8").split(":")
+        post_id = int(post_id)
+    except (ValueError, binascii.Error, UnicodeDecodeError):
+        raise ValueError("invalid_cursor")
+    if order not in ("asc", "desc") or post_id < 0:
+        raise ValueError("invalid_cursor")
+    return post_id, order
+
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+# thread: bcrypt 가 GIL 을 풀어서 스레드로도 여러 코어 사용 / process: 별도 프로세스 풀
+PASSWORD_HASH_EXECUTOR = os.getenv("PASSWORD_HASH_EXECUTOR", "thread")
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(os.cpu_count() or 2)))
+# 실행 중인 작업 외에 대기열에 쌓아 둘 수 있는 최대 개수, 넘으면 바로 503
+PASSWORD_HASH_MAX_QUEUE = int(os.getenv("PASSWORD_HASH_MAX_QUEUE", str(PASSWORD_HASH_WORKERS * 4)))
+
+# min_rounds 보다 cost 가 낮은 기존 해시는 needs_update -> 로그인 성공 시 다시 해시
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=BCRYPT_ROUNDS,
+    bcrypt__min_rounds=BCRYPT_ROUNDS,
+)
+
+_hash_executor = None
+_hash_inflight = 0
 
-# def hash_password(password: str) -> str:
-#     return pwd_context.hash(password)
+def _get_hash_executor():
+    global _hash_executor
+    if _hash_executor is None:
+        if PASSWORD_HASH_EXECUTOR == "process":
+            _hash_executor = ProcessPoolExecutor(max_workers=PASSWORD_HASH_WORKERS)
+        else:
+            _hash_executor = ThreadPoolExecutor(max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="bcrypt")
+    return _hash_executor
 
-# def verify_password(plain_password: str, hashed_password: str) -> bool:
-#     return pwd_context.verify(plain_password, hashed_password)
+def shutdown_hash_executor():
+    global _hash_executor
+    if _hash_executor is not None:
+        _hash_executor.shutdown(wait=False, cancel_futures=True)
+        _hash_executor = None
+
+async def _run_hash_job(fn, *args):
+    # 공용 threadpool 대신 전용 executor 사용, 대기열이 가득 차면 쌓지 않고 바로 거절
+    global _hash_inflight
+    if _hash_inflight >= PASSWORD_HASH_WORKERS + PASSWORD_HASH_MAX_QUEUE:
+        raise HTTPException(status_code=503, detail="password_hash_busy", headers={"Retry-After": "1"})
+    _hash_inflight += 1
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_get_hash_executor(), fn, *args)
+    finally:
+        _hash_inflight -= 1
+
+def hash_password(password: str) -> str:
+    return pwd_context.hash(password)
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return pwd_context.verify(plain_password, hashed_password)
+
+def verify_and_update_password(plain_password: str, hashed_password: str):
+    return pwd_context.verify_and_update(plain_password, hashed_password)
 
 async def hash_password_async(password: str) -> str:
-    return await run_in_threadpool(pwd_context.hash, password)
+    return await _run_hash_job(hash_password, password)
 
 async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
-    return await run_in_threadpool(pwd_context.verify, plain_password, hashed_password)
\ No newline at end of file
+    return await _run_hash_job(verify_password, plain_password, hashed_password)
+
+async def verify_and_update_password_async(plain_password: str, hashed_password: str):
+    # (일치 여부, cost 가 바뀌었을 때만 새 해시 / 아니면 None)
+    return await _run_hash_job(verify_and_update_password, plain_password, hashed_password)
@@ -0,0 +1,42 @@
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from app.services.image_service import IMAGE_DIR, IMAGE_DERIVATIVE_WORKERS, build_derivatives, is_variant_file
+
+# 이미 업로드된 image/ 폴더의 원본들에 대해 썸네일 / WebP 변형을 만들어 둠 (이미 있는 변형은 건너뜀)
+# 사용법: python backfill_images.py [workers]
+
+IMAGE_SUFFIXES = {".jpg", ".jpeg", ".png", ".gif", ".webp"}
+
+
+def main():
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else IMAGE_DERIVATIVE_WORKERS
+    originals = [
+        path.name
+        for path in sorted(IMAGE_DIR.iterdir())
+        if path.is_file()
+        and path.suffix.lower() in IMAGE_SUFFIXES
+        and not path.name.startswith(".")
+        and not is_variant_file(path.name)
+    ]
+    print(f"[backfill] {len(originals)} images in {IMAGE_DIR}")
+
+    created_count = 0
+    failed = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(build_derivatives, name): name for name in originals}
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                created = future.result()
+            except Exception as e:
+                failed += 1
+                print(f"[backfill] {name} failed: {e!r}")
+                continue
+            created_count += len(created)
+            if created:
+                print(f"[backfill] {name} -> {', '.join(created)}")
+    print(f"[backfill] done: {created_count} files created, {failed} failed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+import sys
+import time
+from datetime import datetime
+from fastapi import Request
+from fastapi.responses import JSONResponse
+from app.responses import conditional_json_response
+
+# GET /posts(100개), GET /posts/{id}(댓글 200개) 크기의 응답으로
+# 기존 JSONResponse vs 압축 응답 vs 304(If-None-Match) 의 전송 바이트와 응답 생성 시간을 비교
+# 사용법 (backend 폴더에서): python -m bench.bench_http_cache [iterations]
+
+ITERATIONS = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+LINK_MBPS = 10  # 전송 시간 추정용 모바일 회선 대역폭
+NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+
+def make_request(headers: dict) -> Request:
+    raw = [(key.lower().encode("latin-1"), value.encode("latin-1")) for key, value in headers.items()]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": raw, "query_string": b""})
+
+
+def post_list_page():
+    posts = [
+        {
+            "post_id": i,
+            "title": f"{i}번째 게시글 제목입니다",
+            "author_nickname": f"user{i % 50}",
+            "author_profile_image": f"http://localhost:8000/image/{i:064x}_avatar.webp",
+            "created_at": "2024-01-01 12:00:00",
+            "summary": "오늘 서울의 날씨는 맑고 기온은 어제보다 조금 높겠으며 오후에는 구름이 많아질 것으로 보입니다. " * 2,
+            "views": i * 7,
+            "comments_count": i % 13,
+            "likes": i % 29,
+        }
+        for i in range(1, 101)
+    ]
+    return {"detail": "posts_list_success", "data": {"post_list": posts, "next_cursor": 100, "has_more": True}}
+
+
+def post_detail():
+    comments = [
+        {
+            "comment_id": i,
+            "content": f"{i}번째 댓글입니다. 좋은 글 감사합니다!",
+            "author_nickname": f"user{i % 50}",
+            "author_profile_image": f"http://localhost:8000/image/{i:064x}_avatar.webp",
+            "created_at": "2024-01-01 12:00:00",
+            "user_id": i % 50,
+        }
+        for i in range(1, 201)
+    ]
+    return {
+        "detail": "post_detail_success",
+        "data": {
+            "post_id": 1,
+            "title": "게시글 제목",
+            "content": "본문 내용입니다. " * 300,
+            "comments": comments,
+            "views": 1234,
+            "likes": 56,
+            "comments_count": 200,
+            "is_liked_by_me": False,
+            "like_id": None,
+        },
+    }
+
+
+def measure(build) -> tuple[float, int]:
+    started = time.perf_counter()
+    for _ in range(ITERATIONS):
+        response = build()
+    elapsed_us = (time.perf_counter() - started) / ITERATIONS * 1_000_000
+    return elapsed_us, len(response.body)
+
+
+def main():
+    print(f"{ITERATIONS} iterations\n")
+    print(f"{'payload':12} {'mode':22} {'bytes':>9} {'us/resp':>9} {f'ms@{LINK_MBPS}Mbps':>11}")
+    for name, content in (("list x100", post_list_page()), ("detail x200", post_detail())):
+        plain_request = make_request({})
+        etag = conditional_json_response(plain_request, content, NOW).headers["etag"]
+        modes = {
+            "JSONResponse (before)": lambda: JSONResponse(content=content),
+            "identity + ETag": lambda: conditional_json_response(plain_request, content, NOW),
+            "gzip": lambda: conditional_json_response(make_request({"accept-encoding": "gzip"}), content, NOW),
+            "br (gzip if no brotli)": lambda: conditional_json_response(make_request({"accept-encoding": "br, gzip"}), content, NOW),
+            "304 If-None-Match": lambda: conditional_json_response(make_request({"if-none-match": etag}), content, NOW),
+        }
+        baseline = None
+        for mode, build in modes.items():
+            elapsed_us, size = measure(build)
+            baseline = baseline or size
+            saved = f"-{100 - size * 100 // baseline}%" if size != baseline else ""
+            transfer_ms = size * 8 / (LINK_MBPS * 1_000_000) * 1000
+            print(f"{name:12} {mode:22} {size:9} {elapsed_us:9.1f} {transfer_ms:11.2f}  {saved}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+import asyncio
+import hashlib
+import os
+import sys
+import tempfile
+import time
+import httpx
+from starlette.applications import Starlette
+from starlette.routing import Mount
+from starlette.staticfiles import StaticFiles
+from app.image_files import ImageFiles
+
+# 기존 StaticFiles 마운트와 ImageFiles 의 /image 처리량 비교 (ASGI 앱을 프로세스 안에서 직접 호출)
+# 브라우저/CDN 이 캐시를 가진 상태(If-None-Match 재검증)와 Range 요청도 함께 측정
+# 사용법 (backend 폴더에서): pip install httpx && python -m bench.bench_image_serving [requests] [size_kb]
+
+REQUESTS = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+SIZE_KB = int(sys.argv[2]) if len(sys.argv) > 2 else 256
+CONCURRENCY = 32
+
+
+async def run(client: httpx.AsyncClient, url: str, headers: dict) -> tuple[float, int, int]:
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+    transferred = 0
+    statuses = set()
+
+    async def one():
+        nonlocal transferred
+        async with semaphore:
+            response = await client.get(url, headers=headers)
+            transferred += len(response.content)
+            statuses.add(response.status_code)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(REQUESTS)))
+    elapsed = time.perf_counter() - started
+    return REQUESTS / elapsed, transferred, min(statuses)
+
+
+async def main():
+    with tempfile.TemporaryDirectory() as directory:
+        data = os.urandom(SIZE_KB * 1024)
+        file_name = f"{hashlib.sha256(data).hexdigest()}.jpg"
+        with open(os.path.join(directory, file_name), "wb") as f:
+            f.write(data)
+
+        apps = {
+            "StaticFiles": Starlette(routes=[Mount("/image", StaticFiles(directory=directory))]),
+            "ImageFiles": Starlette(routes=[Mount("/image", ImageFiles(directory=directory))]),
+        }
+        url = f"http://bench/image/{file_name}"
+        print(f"{REQUESTS} requests, {SIZE_KB}KB file, concurrency {CONCURRENCY}\n")
+        print(f"{'app':12} {'scenario':14} {'req/s':>10} {'status':>7} {'bytes':>12}  cache-control")
+        for name, app in apps.items():
+            async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app)) as client:
+                first = await client.get(url)
+                scenarios = {
+                    "full": {},
+                    "revalidate": {"if-none-match": first.headers["etag"]},
+                    "range 64KB": {"range": "bytes=0-65535"},
+                }
+                for scenario, headers in scenarios.items():
+                    rps, transferred, status = await run(client, url, headers)
+                    print(
+                        f"{name:12} {scenario:14} {rps:10.0f} {status:7} {transferred:12}  "
+                        f"{first.headers.get('cache-control', '-')}"
+                    )
+        print("\nImageFiles 는 immutable 헤더로 만료 전에는 브라우저가 요청 자체를 보내지 않음 (위 수치는 캐시 미스 시 비용)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
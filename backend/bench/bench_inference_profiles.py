@@ -0,0 +1,113 @@
+import sys
+import time
+from app.services import summary_service
+
+# 추론 프로필(summary_service.INFERENCE_PROFILES)별 지연 시간 / 처리량 / fp32 대비 요약 품질(ROUGE)
+# 고정된 한국어 샘플로 fp32 기준 요약을 만든 뒤 각 프로필 결과와 ROUGE-1/2/L F1 을 비교
+# 사용법 (backend 폴더에서, SUMMARY_MODEL_PATH 의 모델 필요):
+#   python -m bench.bench_inference_profiles [profile ...]   (생략하면 전체 프로필)
+#   SUMMARY_TORCH_THREADS / SUMMARY_NUM_BEAMS / SUMMARY_MAX_NEW_TOKENS / SUMMARY_LENGTH_PENALTY 도 적용됨
+
+PROFILES = sys.argv[1:] or list(summary_service.INFERENCE_PROFILES)
+BATCH_SIZE = summary_service.MAX_BATCH_SIZE
+SAMPLES = [
+    "서울시는 올해 여름 폭염에 대비해 무더위 쉼터 운영 시간을 밤 9시까지 늘리기로 했다. 시는 노인과 어린이 등 취약계층이 많은 지역을 중심으로 쉼터를 추가로 지정할 계획이다. 기상청은 다음 주부터 낮 최고기온이 35도 안팎까지 오를 것으로 내다봤다.",
+    "정부는 내년부터 청년 월세 지원 대상을 소득 기준 중위 60퍼센트 이하에서 100퍼센트 이하로 넓힌다고 밝혔다. 지원 금액은 월 최대 20만 원으로 최장 12개월 동안 받을 수 있다. 신청은 복지로 누리집과 주소지 행정복지센터에서 할 수 있다.",
+    "국내 연구진이 리튬 대신 나트륨을 쓰는 배터리의 수명을 두 배 가까이 늘리는 전극 소재를 개발했다. 나트륨은 매장량이 풍부해 가격이 싸지만 충전과 방전을 반복하면 전극이 쉽게 망가지는 문제가 있었다. 연구팀은 이 소재를 에너지 저장 장치에 먼저 적용할 계획이다.",
+    "오늘 회사 근처에 새로 생긴 칼국수 집에 다녀왔다. 면은 직접 뽑아서 쫄깃했고 국물은 멸치와 다시마로 우려서 깔끔했다. 다만 점심시간에는 줄이 길어서 30분 넘게 기다려야 했다. 다음에는 조금 일찍 가 볼 생각이다.",
+    "프로야구 정규 시즌이 막바지에 접어들면서 3위부터 6위까지 네 팀이 두 경기 차 안에서 치열한 순위 싸움을 벌이고 있다. 남은 경기 수가 가장 적은 팀은 맞대결 결과에 따라 가을 야구 진출이 갈릴 전망이다. 각 팀은 선발 투수 운용에 총력을 기울이고 있다.",
+    "동네 도서관에서 주말마다 어린이 코딩 교실을 연다고 해서 아이와 함께 신청했다. 블록을 끼워 맞추듯 명령을 조립해 캐릭터를 움직이는 방식이라 아이가 금방 익숙해졌다. 수업은 무료이고 선착순 20명까지 받는다고 한다.",
+    "최근 중고 거래 플랫폼에서 택배 거래를 악용한 사기가 늘고 있다. 판매자가 송장 번호를 보낸 뒤 빈 상자를 보내거나 아예 물건을 보내지 않는 수법이다. 전문가들은 가능하면 직거래를 하고 안전 결제 서비스를 이용하라고 조언했다.",
+    "올해 김장철 배추 가격은 작황이 좋아 지난해보다 20퍼센트가량 내릴 것으로 보인다. 반면 고춧가루와 마늘 값은 여름 장마 피해로 오름세를 보이고 있다. 농림축산식품부는 김장 재료 수급 안정을 위해 비축 물량을 풀기로 했다.",
+]
+
+
+def ngrams(tokens: list[str], n: int) -> dict:
+    counts = {}
+    for i in range(len(tokens) - n + 1):
+        gram = tuple(tokens[i:i + n])
+        counts[gram] = counts.get(gram, 0) + 1
+    return counts
+
+
+def f1(overlap: int, candidate_total: int, reference_total: int) -> float:
+    if overlap == 0 or candidate_total == 0 or reference_total == 0:
+        return 0.0
+    precision = overlap / candidate_total
+    recall = overlap / reference_total
+    return 2 * precision * recall / (precision + recall)
+
+
+def rouge_n(candidate: list[str], reference: list[str], n: int) -> float:
+    candidate_grams, reference_grams = ngrams(candidate, n), ngrams(reference, n)
+    overlap = sum(min(count, reference_grams.get(gram, 0)) for gram, count in candidate_grams.items())
+    return f1(overlap, sum(candidate_grams.values()), sum(reference_grams.values()))
+
+
+def rouge_l(candidate: list[str], reference: list[str]) -> float:
+    previous = [0] * (len(reference) + 1)
+    for token in candidate:
+        current = [0]
+        for j, reference_token in enumerate(reference):
+            current.append(previous[j] + 1 if token == reference_token else max(previous[j + 1], current[j]))
+        previous = current
+    return f1(previous[-1], len(candidate), len(reference))
+
+
+def rouge(candidates: list[str], references: list[str]) -> tuple[float, float, float]:
+    # 어절(공백) 단위, 샘플 평균 F1
+    scores = []
+    for candidate, reference in zip(candidates, references):
+        c, r = candidate.split(), reference.split()
+        scores.append((rouge_n(c, r, 1), rouge_n(c, r, 2), rouge_l(c, r)))
+    return tuple(sum(values) / len(values) for values in zip(*scores))
+
+
+def run_profile(profile: str, params: dict):
+    tokenizer, model = summary_service.load_pretrained(summary_service.INFERENCE_PROFILES[profile]["quantize"])
+    summary_service.tokenizer = tokenizer
+    summary_service.generate_summaries([summary_service.WARMUP_TEXT], model, params)
+
+    # 지연 시간: 한 건씩 / 처리량: BATCH_SIZE 씩 묶어서 (실서비스 배치와 같은 크기)
+    latencies = []
+    outputs = []
+    for sample in SAMPLES:
+        started = time.perf_counter()
+        outputs.extend(summary_service.generate_summaries([sample], model, params))
+        latencies.append(time.perf_counter() - started)
+    started = time.perf_counter()
+    for start in range(0, len(SAMPLES), BATCH_SIZE):
+        summary_service.generate_summaries(SAMPLES[start:start + BATCH_SIZE], model, params)
+    batch_elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "max_ms": latencies[-1] * 1000,
+        "throughput": len(SAMPLES) / batch_elapsed,
+        "outputs": outputs,
+        "params": params,
+    }
+
+
+def main():
+    print(f"{len(SAMPLES)} samples, batch {BATCH_SIZE}, torch threads {summary_service.TORCH_THREADS or 'default'}\n")
+    # 기준은 환경 변수 덮어쓰기 없이 기존 동작 그대로의 fp32
+    baseline = run_profile("fp32", dict(summary_service.INFERENCE_PROFILES["fp32"]["generation"]))
+    results = {"fp32 baseline": baseline}
+    for profile in PROFILES:
+        results[profile] = run_profile(profile, summary_service.generation_params(profile))
+
+    print(f"{'profile':14} {'p50 ms':>8} {'max ms':>8} {'posts/s':>8} {'R-1':>6} {'R-2':>6} {'R-L':>6}  params")
+    for profile, result in results.items():
+        r1, r2, rl = rouge(result["outputs"], baseline["outputs"])
+        print(
+            f"{profile:14} {result['p50_ms']:8.0f} {result['max_ms']:8.0f} {result['throughput']:8.2f} "
+            f"{r1:6.3f} {r2:6.3f} {rl:6.3f}  {result['params']}"
+        )
+    print("\nR-1/R-2/R-L: fp32 요약 대비 F1 (1.000 = 같은 요약)")
+    for profile, result in results.items():
+        print(f"\n[{profile}] {result['outputs'][0]}")
+
+
+if __name__ == "__main__":
+    main()
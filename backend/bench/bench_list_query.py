@@ -0,0 +1,114 @@
+import asyncio
+import os
+import sys
+import time
+import tracemalloc
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from app.db import Base, engine
+from app.entity.user_entity import User
+from app.entity.post_entity import Post
+from app.models import post_model
+
+# GET /posts 목록 쿼리: 기존 Post 엔티티 전체 조회(content 포함) vs 필요한 컬럼만 조회
+# 게시글을 채운 뒤 100개씩 keyset 으로 끝까지 읽으며 페이지당 시간과 Python 메모리 최대치를 비교
+# 모든 데이터는 하나의 트랜잭션 안에서 넣고 마지막에 rollback 하므로 DB 에 흔적이 남지 않음
+# 사용법 (backend 폴더에서): python -m bench.bench_list_query [posts] [content_kb]
+#   BENCH_DATABASE_URL 을 주면 .env 의 DB 대신 그 DB 에 테이블을 만들고 측정 (예: 빈 테스트 DB)
+
+POSTS = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+CONTENT_KB = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+PAGE_SIZE = 100
+SEED_BATCH = 500
+
+
+async def legacy_post_list(db: AsyncSession, cursor_id: int, count: int):
+    # 변경 전 get_post_list_by_id (asc)
+    stmt = (
+        select(Post, User.nickname, User.profile_image)
+        .join(User, User.user_id == Post.user_id)
+        .where(Post.post_id > cursor_id)
+        .order_by(Post.post_id.asc())
+    )
+    result = await db.execute(stmt.limit(count))
+    return [(row[0].post_id, row) for row in result.all()]
+
+
+async def projected_post_list(db: AsyncSession, cursor_id: int, count: int):
+    rows = await post_model.get_post_list_by_id(db, cursor_id, count, "asc")
+    return [(row.post_id, row) for row in rows]
+
+
+async def seed(db: AsyncSession) -> int:
+    user = User(email="bench-list@example.com", nickname="benchlist", password="x", profile_image=None)
+    db.add(user)
+    await db.flush()
+    content = "가" * (CONTENT_KB * 1024 // 3)  # utf8mb4 한글 3바이트
+    for start in range(0, POSTS, SEED_BATCH):
+        rows = [
+            {
+                "user_id": user.user_id,
+                "title": f"bench post {i}",
+                "content": content,
+                "summary": "요약 " * 20,
+                "author_nickname": user.nickname,
+                "views": i,
+                "comments_count": 0,
+                "likes": 0,
+            }
+            for i in range(start, min(start + SEED_BATCH, POSTS))
+        ]
+        await db.execute(insert(Post), rows)
+    await db.flush()
+    first = await db.execute(select(Post.post_id).where(Post.user_id == user.user_id).order_by(Post.post_id).limit(1))
+    return first.scalar_one() - 1
+
+
+async def walk(db: AsyncSession, fetch, start_cursor: int) -> tuple[float, float, int]:
+    cursor_id = start_cursor
+    pages = 0
+    total = 0.0
+    peak = 0
+    while True:
+        db.expunge_all()
+        tracemalloc.start()
+        started = time.perf_counter()
+        rows = await fetch(db, cursor_id, PAGE_SIZE)
+        total += time.perf_counter() - started
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+        if not rows:
+            break
+        pages += 1
+        cursor_id = rows[-1][0]
+        del rows
+    return total / max(pages, 1) * 1000, peak / 1024, pages
+
+
+async def main():
+    bench_url = os.getenv("BENCH_DATABASE_URL")
+    bench_engine = create_async_engine(bench_url) if bench_url else engine
+    async with bench_engine.connect() as conn:
+        if bench_url:
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.commit()
+        outer = await conn.begin()
+        db = AsyncSession(bind=conn, join_transaction_mode="create_savepoint", expire_on_commit=False)
+        print(f"seeding {POSTS} posts, content {CONTENT_KB}KB ...")
+        start_cursor = await seed(db)
+
+        print(f"\n{'query':22} {'pages':>6} {'ms/page':>9} {'peak KB/page':>13}")
+        # 한 번씩 먼저 돌려서 DB 버퍼 캐시를 같은 상태로 맞춤
+        for name, fetch in (("entity (before)", legacy_post_list), ("projection (after)", projected_post_list)):
+            await walk(db, fetch, start_cursor)
+        for name, fetch in (("entity (before)", legacy_post_list), ("projection (after)", projected_post_list)):
+            ms_per_page, peak_kb, pages = await walk(db, fetch, start_cursor)
+            print(f"{name:22} {pages:6} {ms_per_page:9.2f} {peak_kb:13.0f}")
+
+        await db.close()
+        await outer.rollback()
+    await bench_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,69 @@
+import asyncio
+import sys
+import time
+from app.services import summary_service
+
+# 본문 길이별 요약 지연 시간: 한 번에 generate (MAX_INPUT_TOKENS 에서 잘림) vs 조각 요약 후 다시 요약 (map-reduce)
+# 요약 캐시를 거치지 않고 summary_service 의 generate 경로만 측정
+# 사용법 (backend 폴더에서, SUMMARY_MODEL_PATH 의 모델 필요): python -m bench.bench_long_summary [repeat]
+
+REPEAT = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+LENGTHS = [300, 1500, 3000, 6000, 12000]  # 글자 수
+SENTENCES = [
+    "서울시는 올해 여름 폭염에 대비해 무더위 쉼터 운영 시간을 밤 9시까지 늘리기로 했다.",
+    "시는 노인과 어린이 등 취약계층이 많은 지역을 중심으로 쉼터를 추가로 지정할 계획이다.",
+    "기상청은 다음 주부터 낮 최고기온이 35도 안팎까지 오를 것으로 내다봤다.",
+    "전문가들은 한낮 야외 활동을 줄이고 물을 자주 마실 것을 당부했다.",
+    "한편 전력 수요가 늘어날 것에 대비해 정부는 비상 대응 체계를 점검하고 있다.",
+    "일부 자치구는 도로에 물을 뿌리는 살수차 운행 횟수도 늘리기로 했다.",
+]
+
+
+def make_content(length: int) -> str:
+    parts = []
+    total = 0
+    index = 0
+    while total < length:
+        sentence = SENTENCES[index % len(SENTENCES)]
+        parts.append(sentence)
+        total += len(sentence) + 1
+        index += 1
+        if index % 4 == 0:
+            parts.append("\n")
+    return " ".join(parts)
+
+
+async def timed(coro_factory) -> tuple[float, str]:
+    best = None
+    result = ""
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        result = await coro_factory()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1000, result
+
+
+async def main():
+    summary_service.load_model()
+    if summary_service.model_state != "ready":
+        print("model not ready:", summary_service.model_error)
+        return
+    summary_service.batcher.start()
+
+    print(f"chunk_tokens={summary_service.CHUNK_TOKENS} max_input_tokens={summary_service.MAX_INPUT_TOKENS} repeat={REPEAT} (best)\n")
+    print(f"{'chars':>6} {'tokens':>7} {'chunks':>6} {'single ms':>10} {'map-reduce ms':>14} {'summary chars':>14}")
+    for length in LENGTHS:
+        content = make_content(length)
+        tokens = len(summary_service.tokenizer(content, add_special_tokens=False)["input_ids"])
+        chunks = summary_service.split_chunks(content)
+        single_ms, _ = await timed(lambda: summary_service.batcher.summarize(content))
+        chunked_ms, summary = await timed(lambda: summary_service._generate(content))
+        summary = summary_service.clip_summary(summary)
+        print(f"{len(content):6} {tokens:7} {len(chunks):6} {single_ms:10.0f} {chunked_ms:14.0f} {len(summary):14}")
+
+    await summary_service.batcher.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,94 @@
+import sys
+import time
+from datetime import datetime
+from types import SimpleNamespace
+from fastapi.responses import JSONResponse as StdJSONResponse
+from app.responses import JSONResponse, precomputed
+from app.controllers.post_controller import _post_list_item, _comment_item
+
+# 100개 게시글 목록 페이지 / 댓글 500개 상세 응답 직렬화 마이크로벤치마크
+#   before : strftime + 표준 json (기존 컨트롤러)
+#   after  : format_timestamp + orjson
+#   cached : 상세 댓글 목록을 미리 직렬화(orjson.Fragment)해 둔 캐시 적중 경로
+# 사용법 (backend 폴더에서): python -m bench.bench_serialization [iterations]
+
+ITERATIONS = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+
+def post_rows(n):
+    # post_model.POST_LIST_COLUMNS 행과 같은 이름의 속성
+    return [
+        SimpleNamespace(
+            post_id=i, title=f"{i}번째 게시글 제목", created_at=NOW, updated_at=None,
+            summary="짧은 요약 문장입니다. " * 5, views=i * 3, comments_count=i % 7, likes=i % 11,
+            author_nickname=f"user{i % 40}", author_profile_image=None,
+        )
+        for i in range(1, n + 1)
+    ]
+
+
+def comment_rows(n):
+    return [
+        (
+            SimpleNamespace(comment_id=i, content=f"{i}번째 댓글 내용입니다.", created_at=NOW, user_id=i % 40),
+            f"user{i % 40}",
+            None,
+        )
+        for i in range(1, n + 1)
+    ]
+
+
+def legacy_post_item(p):
+    return {
+        "post_id": p.post_id,
+        "title": p.title,
+        "author_nickname": p.author_nickname,
+        "author_profile_image": p.author_profile_image,
+        "created_at": p.created_at.strftime("%Y-%m-%d %H:%M:%S") if p.created_at else None,
+        "summary": p.summary,
+        "views": p.views,
+        "comments_count": p.comments_count,
+        "likes": p.likes,
+    }
+
+
+def legacy_comment_item(c, nickname, profile_image):
+    return {
+        "comment_id": c.comment_id,
+        "content": c.content,
+        "author_nickname": nickname,
+        "author_profile_image": profile_image,
+        "created_at": c.created_at.strftime("%Y-%m-%d %H:%M:%S") if c.created_at else None,
+        "user_id": c.user_id,
+    }
+
+
+def measure(build) -> tuple[float, int]:
+    started = time.perf_counter()
+    for _ in range(ITERATIONS):
+        response = build()
+    return (time.perf_counter() - started) / ITERATIONS * 1_000_000, len(response.body)
+
+
+def main():
+    posts = post_rows(100)
+    comments = comment_rows(500)
+    cached_comments = precomputed([_comment_item(*row) for row in comments])
+
+    cases = {
+        "list x100 before": lambda: StdJSONResponse({"data": {"post_list": [legacy_post_item(r) for r in posts]}}),
+        "list x100 after": lambda: JSONResponse({"data": {"post_list": [_post_list_item(r) for r in posts]}}),
+        "detail x500 before": lambda: StdJSONResponse({"data": {"comments": [legacy_comment_item(*r) for r in comments]}}),
+        "detail x500 after": lambda: JSONResponse({"data": {"comments": [_comment_item(*r) for r in comments]}}),
+        "detail x500 cached": lambda: JSONResponse({"data": {"comments": cached_comments}}),
+    }
+    print(f"{ITERATIONS} iterations\n")
+    print(f"{'case':22} {'us/resp':>10} {'bytes':>9}")
+    for name, build in cases.items():
+        elapsed_us, size = measure(build)
+        print(f"{name:22} {elapsed_us:10.1f} {size:9}")
+
+
+if __name__ == "__main__":
+    main()
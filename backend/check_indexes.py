@@ -0,0 +1,93 @@
+import asyncio
+import sys
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db import engine
+from app.models import user_model, post_model, comment_model, like_model, summary_cache_model
+
+# app/models 의 쿼리를 실제로 실행해서 나온 SQL 마다 EXPLAIN 을 돌려 인덱스를 타는지 확인.
+# 모든 작업은 하나의 트랜잭션 안에서 하고 마지막에 rollback 하므로 DB 에 흔적이 남지 않음.
+# 사용법: python create_table.py --migrate && python check_indexes.py
+
+
+async def prepare_checks(db: AsyncSession):
+    user = await user_model.create_user(db, "explain-check@example.com", "x", "explainchk", None)
+    post = await post_model.create_post(db, user.user_id, "title", "content", "summary", None, user.nickname)
+    comment = await comment_model.create_comment(db, post.post_id, user.user_id, "comment")
+    like = await like_model.create_like(db, post.post_id, user.user_id)
+    await db.commit()
+
+    checks = [
+        ("user_model.get_user_by_email", lambda: user_model.get_user_by_email(db, user.email)),
+        ("user_model.get_user_by_nickname", lambda: user_model.get_user_by_nickname(db, user.nickname)),
+        ("user_model.get_user_by_id", lambda: user_model.get_user_by_id(db, user.user_id)),
+        ("post_model.get_post_by_id", lambda: post_model.get_post_by_id(db, post.post_id)),
+        ("post_model.get_post_with_author", lambda: post_model.get_post_with_author(db, post.post_id)),
+        ("post_model.get_post_list_by_id(asc)", lambda: post_model.get_post_list_by_id(db, 0, 10, "asc")),
+        ("post_model.get_post_list_by_id(desc)", lambda: post_model.get_post_list_by_id(db, post.post_id + 1, 10, "desc")),
+        ("post_model.get_post_summary", lambda: post_model.get_post_summary(db, post.post_id)),
+        ("post_model.get_pending_summary_posts", lambda: post_model.get_pending_summary_posts(db, 0, 100)),
+        ("post_model.set_summary", lambda: post_model.set_summary(db, post.post_id, "summary", "done", "kobart")),
+        ("post_model.update_likes", lambda: post_model.update_likes(db, post.post_id, 1)),
+        ("post_model.update_comments_count", lambda: post_model.update_comments_count(db, post.post_id, 1)),
+        ("post_model.get_posts_for_resummary", lambda: post_model.get_posts_for_resummary(db, 0, 100)),
+        ("post_model.set_summaries", lambda: post_model.set_summaries(db, {post.post_id: ("summary", "kobart")})),
+        ("post_model.add_views", lambda: post_model.add_views(db, {post.post_id: 1})),
+        ("comment_model.get_comment_by_id", lambda: comment_model.get_comment_by_id(db, comment.comment_id)),
+        ("comment_model.get_comment_by_post_id", lambda: comment_model.get_comment_by_post_id(db, post.post_id)),
+        ("comment_model.get_comment_with_author_by_post_id", lambda: comment_model.get_comment_with_author_by_post_id(db, post.post_id, 0, 20)),
+        ("like_model.get_like_by_id", lambda: like_model.get_like_by_id(db, like.like_id)),
+        ("like_model.get_my_like", lambda: like_model.get_my_like(db, post.post_id, user.user_id)),
+        ("like_model.get_my_likes", lambda: like_model.get_my_likes(db, [post.post_id, post.post_id + 1], user.user_id)),
+        ("summary_cache_model.get_summary", lambda: summary_cache_model.get_summary(db, "0" * 64)),
+        ("like_model.delete_like", lambda: like_model.delete_like(db, like.like_id)),
+        ("comment_model.delete_comment", lambda: comment_model.delete_comment(db, comment.comment_id)),
+        ("post_model.delete_post", lambda: post_model.delete_post(db, post.post_id)),
+    ]
+    return checks
+
+
+async def main() -> int:
+    failures = []
+    async with engine.connect() as conn:
+        outer = await conn.begin()
+        captured = []
+
+        def capture(connection, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith(("SELECT", "UPDATE", "DELETE")):
+                captured.append((statement, parameters))
+
+        # 모델 함수 안의 commit 은 savepoint 만 닫고, 바깥 트랜잭션은 마지막에 rollback
+        db = AsyncSession(bind=conn, join_transaction_mode="create_savepoint", expire_on_commit=False)
+        checks = await prepare_checks(db)
+
+        event.listen(conn.sync_connection, "before_cursor_execute", capture)
+        for name, run in checks:
+            captured.clear()
+            await run()
+            statements = list(captured)
+            for statement, parameters in statements:
+                plan = await conn.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+                for row in plan.mappings():
+                    if row.get("table") is None:
+                        continue
+                    if row.get("key") is None:
+                        failures.append((name, row.get("table"), row.get("type")))
+                    print(f"{name:55} {row.get('table'):10} type={row.get('type')} key={row.get('key')}")
+        event.remove(conn.sync_connection, "before_cursor_execute", capture)
+
+        await db.close()
+        await outer.rollback()
+    await engine.dispose()
+
+    if failures:
+        print("\n[explain-check] queries without index:")
+        for name, table, scan_type in failures:
+            print(f"  {name}: table={table} type={scan_type}")
+        return 1
+    print("\n[explain-check] every model query uses an index")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
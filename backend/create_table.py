@@ -1,10 +1,14 @@
 import asyncio
+import sys
+from sqlalchemy import inspect, text
+from sqlalchemy.schema import CreateColumn
 from sqlalchemy.ext.asyncio import AsyncEngine
 from app.db import Base, engine
 from app.entity.user_entity import User
 from app.entity.post_entity import Post
 from app.entity.comment_entity import Comment
 from app.entity.like_entity import Like
+from app.entity.summary_cache_entity import SummaryCache
 
 async def async_reset_db(async_engine: AsyncEngine):
     async with async_engine.begin() as conn:
@@ -17,8 +21,52 @@ def sync_reset_db(sync_engine):
     Base.metadata.drop_all(bind=sync_engine)
     Base.metadata.create_all(bind=sync_engine)
 
+# drop_all 없이 기존 데이터를 유지한 채로 없는 테이블 / 컬럼 / 인덱스만 추가
+def migrate_schema(conn):
+    insp = inspect(conn)
+    existing_tables = set(insp.get_table_names())
+    preparer = conn.dialect.identifier_preparer
+
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            table.create(conn)
+            print(f"[migrate] create table {table.name}")
+            continue
+
+        existing_columns = {c["name"] for c in insp.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing_columns:
+                continue
+            column_ddl = CreateColumn(column).compile(dialect=conn.dialect)
+            conn.execute(text(f"ALTER TABLE {preparer.format_table(table)} ADD COLUMN {column_ddl}"))
+            print(f"[migrate] add column {table.name}.{column.name}")
+
+        existing_indexes = {i["name"] for i in insp.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name in existing_indexes:
+                continue
+            index.create(conn)
+            print(f"[migrate] create index {table.name}.{index.name}")
+
+async def async_migrate_db(async_engine: AsyncEngine):
+    async with async_engine.begin() as conn:
+        await conn.run_sync(migrate_schema)
+
+def sync_migrate_db(sync_engine):
+    with sync_engine.begin() as conn:
+        migrate_schema(conn)
+
 if __name__ == "__main__":
+    # python create_table.py            -> 전체 테이블 삭제 후 재생성
+    # python create_table.py --migrate  -> 데이터 유지, 빠진 테이블/컬럼/인덱스만 추가
+    migrate = "--migrate" in sys.argv[1:]
     if isinstance(engine, AsyncEngine):
-        asyncio.run(async_reset_db(engine))
+        if migrate:
+            asyncio.run(async_migrate_db(engine))
+        else:
+            asyncio.run(async_reset_db(engine))
     else:
-        sync_reset_db(engine)
\ No newline at end of file
+        if migrate:
+            sync_migrate_db(engine)
+        else:
+            sync_reset_db(engine)
@@ -0,0 +1,152 @@
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from app.db import engine, AsyncSessionLocal
+from app.models import post_model
+from app.services import summary_service, extractive_summary
+
+# 모델 / 요약 설정을 바꾼 뒤 기존 게시글의 posts.summary 를 다시 만드는 오프라인 도구
+# post_id 순서로 읽어서 프로세스 풀(프로세스마다 모델 하나)에서 배치로 요약하고, 배치마다 UPDATE 한 번 + 체크포인트 저장
+# 사용법:
+#   python resummarize.py                       # 전체 게시글
+#   python resummarize.py --only extractive     # 추출 요약으로 저장된 글만 KoBART 로 다시 요약
+#   python resummarize.py --only failed         # 요약 실패한 글만
+#   python resummarize.py --restart             # 체크포인트 무시하고 처음부터
+# 중간에 멈춰도 같은 명령으로 다시 실행하면 마지막으로 저장한 post_id 다음부터 이어서 처리
+
+CPU_COUNT = os.cpu_count() or 1
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="re-generate posts.summary for existing posts")
+    parser.add_argument("--only", choices=("all", "extractive", "failed"), default="all")
+    parser.add_argument("--workers", type=int, default=max(1, CPU_COUNT // 4), help="모델 프로세스 수")
+    parser.add_argument("--batch-size", type=int, default=32, help="프로세스 하나가 한 번에 맡는 게시글 수 = UPDATE 한 번의 크기")
+    parser.add_argument("--pause-ms", type=int, default=200, help="UPDATE 사이 쉬는 시간 (운영 DB 부하 조절)")
+    parser.add_argument("--checkpoint", default=".resummarize_checkpoint.json")
+    parser.add_argument("--restart", action="store_true", help="체크포인트 무시")
+    return parser.parse_args()
+
+
+def init_worker(torch_threads: int):
+    # 코어를 프로세스끼리 나눠 쓰도록 torch 스레드 수 제한 후 모델 로딩
+    summary_service.TORCH_THREADS = torch_threads
+    summary_service.load_model()
+    if summary_service.model_state != "ready":
+        raise RuntimeError(f"summary model load failed: {summary_service.model_error}")
+
+
+def summarize_batch(rows: list[tuple[int, str]]) -> dict[int, tuple[str, str]]:
+    # 서비스와 같은 기준: 짧은 글은 추출 요약, 나머지는 KoBART (긴 글은 조각 요약 후 재요약)
+    results = {}
+    model_rows = []
+    for post_id, content in rows:
+        if summary_service.choose_summarizer(content) == "extractive":
+            summary = extractive_summary.summarize(content, summary_service.SUMMARY_MAX_CHARS)
+            results[post_id] = (summary_service.clip_summary(summary), "extractive")
+        else:
+            model_rows.append((post_id, content))
+    if model_rows:
+        summaries = summary_service.summarize_texts([content for _, content in model_rows])
+        for (post_id, _), summary in zip(model_rows, summaries):
+            results[post_id] = (summary, "kobart")
+    return results
+
+
+def fingerprint(only: str) -> str:
+    # 설정이 바뀌면 이전 체크포인트는 쓰지 않음
+    return json.dumps(
+        {"model": summary_service.MODEL_PATH, "params": summary_service.CACHE_PARAMS, "only": only},
+        sort_keys=True,
+    )
+
+
+def load_checkpoint(path: str, key: str) -> int:
+    try:
+        with open(path, encoding="utf-8") as f:
+            saved = json.load(f)
+    except FileNotFoundError:
+        return 0
+    if saved.get("fingerprint") != key:
+        print("[resummarize] checkpoint is for different settings, starting over")
+        return 0
+    return saved["cursor_id"]
+
+
+def save_checkpoint(path: str, key: str, cursor_id: int, updated: int):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"fingerprint": key, "cursor_id": cursor_id, "updated": updated}, f)
+    os.replace(tmp_path, path)
+
+
+async def run(args) -> int:
+    key = fingerprint(args.only)
+    cursor_id = 0 if args.restart else load_checkpoint(args.checkpoint, key)
+    if cursor_id:
+        print(f"[resummarize] resuming after post_id {cursor_id}")
+
+    loop = asyncio.get_running_loop()
+    torch_threads = max(1, CPU_COUNT // args.workers)
+    # 프로세스마다 배치 하나를 처리하는 동안 다음 배치 하나씩 대기 -> 모델 프로세스가 쉬지 않도록
+    max_inflight = args.workers * 2
+    inflight: deque = deque()
+    updated = 0
+    skipped = 0
+    started = time.perf_counter()
+    exhausted = False
+
+    with ProcessPoolExecutor(
+        max_workers=args.workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=init_worker,
+        initargs=(torch_threads,),
+    ) as executor:
+        read_cursor = cursor_id
+        while inflight or not exhausted:
+            # 읽기: 짧은 세션으로 batch_size 개씩, 커넥션은 요약하는 동안 잡지 않음
+            while not exhausted and len(inflight) < max_inflight:
+                async with AsyncSessionLocal() as db:
+                    rows = await post_model.get_posts_for_resummary(db, read_cursor, args.batch_size, args.only)
+                if not rows:
+                    exhausted = True
+                    break
+                read_cursor = rows[-1].post_id
+                batch = [(row.post_id, row.content) for row in rows]
+                content_hashes = {row.post_id: row.content_hash for row in rows}
+                inflight.append((read_cursor, content_hashes, loop.run_in_executor(executor, summarize_batch, batch)))
+
+            if not inflight:
+                break
+            # 쓰기: 읽은 순서대로 반영해야 체크포인트 이전의 글이 모두 처리된 상태가 보장됨
+            batch_cursor, content_hashes, future = inflight.popleft()
+            summaries = await future
+            # 요약하는 동안 수정된 글은 건너뜀 (수정 시 서버의 요약 작업이 새 본문으로 다시 요약)
+            async with AsyncSessionLocal() as db:
+                written = await post_model.set_summaries(db, summaries, content_hashes)
+            updated += written
+            skipped += len(summaries) - written
+            save_checkpoint(args.checkpoint, key, batch_cursor, updated)
+
+            elapsed = time.perf_counter() - started
+            print(
+                f"[resummarize] post_id <= {batch_cursor}: {updated} updated, {skipped} skipped (edited), "
+                f"{updated / elapsed:.1f} posts/s"
+            )
+            if args.pause_ms:
+                await asyncio.sleep(args.pause_ms / 1000)
+
+    await engine.dispose()
+    # 실행 중인 서버의 응답 캐시에는 RESPONSE_CACHE_TTL_SECONDS 후 반영
+    print(f"[resummarize] done: {updated} posts in {time.perf_counter() - started:.0f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(run(parse_args())))
@@ -0,0 +1,64 @@
+import asyncio
+import orjson
+from fastapi import HTTPException
+from sqlalchemy import select, func
+from app.controllers import like_controller, comment_controller
+from app.entity.post_entity import Post
+from app.entity.like_entity import Like
+from app.entity.comment_entity import Comment
+from conftest import make_request, create_users, create_post_row
+
+PARALLEL_USERS = 20
+
+
+async def call(maker, handler, *args, user_id: int, body: dict | None = None):
+    # 라우터 + get_db 와 같이 요청마다 세션 하나
+    async with maker() as db:
+        try:
+            response = await handler(*args, make_request(user_id, body), db)
+        except HTTPException as e:
+            return e.status_code, e.detail
+        return response.status_code, orjson.loads(response.body)
+
+
+async def counters(maker, post_id: int):
+    async with maker() as db:
+        post = (await db.execute(select(Post.likes, Post.comments_count).where(Post.post_id == post_id))).one()
+        likes = await db.scalar(select(func.count()).select_from(Like).where(Like.post_id == post_id))
+        comments = await db.scalar(select(func.count()).select_from(Comment).where(Comment.post_id == post_id))
+    return post.likes, likes, post.comments_count, comments
+
+
+def test_parallel_likes_and_comments_keep_counters_in_sync(sessionmaker, run):
+    async def scenario():
+        user_ids = await create_users(sessionmaker, PARALLEL_USERS)
+        post_id = await create_post_row(sessionmaker, user_ids[0])
+
+        # 모든 사용자가 동시에 좋아요 + 댓글, 같은 사용자의 중복 좋아요도 동시에
+        results = await asyncio.gather(
+            *(call(sessionmaker, like_controller.create_like, user_id=u, body={"post_id": post_id, "user_id": u}) for u in user_ids),
+            *(call(sessionmaker, like_controller.create_like, user_id=u, body={"post_id": post_id, "user_id": u}) for u in user_ids[:5]),
+            *(call(sessionmaker, comment_controller.create_comment, user_id=u, body={"post_id": post_id, "user_id": u, "content": "댓글"}) for u in user_ids),
+        )
+        like_results = results[:PARALLEL_USERS + 5]
+        comment_results = results[PARALLEL_USERS + 5:]
+        assert sum(status == 201 for status, _ in like_results) == PARALLEL_USERS
+        assert all(status in (201, 400) for status, _ in like_results)
+        assert all(status == 201 for status, _ in comment_results)
+        assert await counters(sessionmaker, post_id) == (PARALLEL_USERS, PARALLEL_USERS, PARALLEL_USERS, PARALLEL_USERS)
+
+        # 절반은 좋아요 취소 / 댓글 삭제를 동시에
+        like_ids = {body["data"]["like_id"]: None for status, body in like_results if status == 201}
+        async with sessionmaker() as db:
+            owners = dict((await db.execute(select(Like.like_id, Like.user_id).where(Like.like_id.in_(list(like_ids))))).all())
+            comments = (await db.execute(select(Comment.comment_id, Comment.user_id).where(Comment.post_id == post_id))).all()
+        removed = PARALLEL_USERS // 2
+        results = await asyncio.gather(
+            *(call(sessionmaker, like_controller.delete_like, like_id, user_id=owners[like_id]) for like_id in list(owners)[:removed]),
+            *(call(sessionmaker, comment_controller.delete_comment, comment_id, user_id=user_id) for comment_id, user_id in comments[:removed]),
+        )
+        assert all(status == 200 for status, _ in results)
+        remaining = PARALLEL_USERS - removed
+        assert await counters(sessionmaker, post_id) == (remaining, remaining, remaining, remaining)
+
+    run(scenario())
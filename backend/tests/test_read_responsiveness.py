@@ -0,0 +1,72 @@
+import time
+import asyncio
+from sqlalchemy import select
+from app.controllers import post_controller
+from app.entity.post_entity import Post
+from app.services import summary_service, response_cache
+from app.services.summary_jobs import SummaryJobs
+from conftest import make_request, create_users, TEST_POOL_SIZE
+
+POSTS = 12
+GENERATE_SECONDS = 0.4  # 배치 하나 generate 시간 (CPU 추론처럼 스레드를 막음)
+MAX_READ_SECONDS = 0.25
+LONG_CONTENT = "요약 모델이 처리해야 하는 긴 본문입니다. " * 20  # EXTRACTIVE_MAX_CHARS 보다 길게 -> kobart 경로
+
+
+def test_reads_stay_fast_while_posts_are_summarized(sessionmaker, engine, run, monkeypatch):
+    jobs = SummaryJobs(concurrency=POSTS)
+    monkeypatch.setattr(post_controller, "summary_jobs", jobs)
+    monkeypatch.setattr(summary_service, "model_state", "ready")
+    pool = engine.sync_engine.pool
+    # generate 도중 (이전 배치의 저장이 끝난 뒤) 잡혀 있는 커넥션 수
+    checked_out_during_generate = []
+
+    def slow_generate(texts, target_model=None, params=None):
+        time.sleep(GENERATE_SECONDS / 2)
+        checked_out_during_generate.append(pool.checkedout())
+        time.sleep(GENERATE_SECONDS / 2)
+        return [f"요약 {len(text)}" for text in texts]
+
+    monkeypatch.setattr(summary_service, "generate_summaries", slow_generate)
+    monkeypatch.setattr(summary_service, "split_chunks", lambda content: [content])
+
+    async def scenario():
+        (user_id,) = await create_users(sessionmaker, 1)
+
+        async def create(index):
+            async with sessionmaker() as db:
+                body = {"user_id": user_id, "title": f"글 {index}", "content": f"{index} {LONG_CONTENT}"}
+                return await post_controller.create_post(make_request(user_id, body), db)
+
+        started = time.perf_counter()
+        responses = await asyncio.gather(*(create(i) for i in range(POSTS)))
+        # 작성은 요약을 기다리지 않음
+        assert all(response.status_code == 201 for response in responses)
+        assert time.perf_counter() - started < GENERATE_SECONDS
+
+        latencies = []
+        while jobs.pending():
+            # 캐시를 비워서 매번 DB 까지 읽음
+            response_cache.invalidate_all()
+            read_started = time.perf_counter()
+            async with sessionmaker() as db:
+                response = await post_controller.list_posts(0, 10, "asc", None, make_request(user_id, method="GET"), db)
+            latencies.append(time.perf_counter() - read_started)
+            assert response.status_code == 200
+            await asyncio.sleep(0.05)
+
+        # 요약이 끝날 때까지 여러 번 읽었고, 매번 generate 한 번보다 훨씬 빨랐음
+        assert len(latencies) >= 5
+        assert max(latencies) < MAX_READ_SECONDS
+        # 요약을 기다리는 작업은 커넥션을 잡지 않음 (겹친 목록 조회 1개까지만)
+        assert checked_out_during_generate
+        assert max(checked_out_during_generate) <= 1 < TEST_POOL_SIZE
+
+        async with sessionmaker() as db:
+            rows = (await db.execute(select(Post.summary_status, Post.summarizer))).all()
+        assert [tuple(row) for row in rows] == [("done", "kobart")] * POSTS
+
+        await jobs.stop()
+        await summary_service.batcher.stop()
+
+    run(scenario())
@@ -46,6 +46,50 @@ function isValidNickname(nickname) {
   return true;
 }
 
+// 요약은 게시글 작성 후 서버에서 만들어짐: 끝나면 SSE 로 받아서 표시
+// 요약 대기 글이 여러 개여도 연결은 하나만 (브라우저는 origin 당 연결 6개까지라 글마다 열면 다른 요청이 막힘)
+const summaryWatch = { elements: new Map(), source: null };
+
+function watchSummaries(entries) {
+  entries.forEach(([postId, summaryEl]) =>
+    summaryWatch.elements.set(String(postId), summaryEl)
+  );
+  if (summaryWatch.source) summaryWatch.source.close();
+  summaryWatch.source = null;
+  if (summaryWatch.elements.size === 0) return;
+
+  const postIds = [...summaryWatch.elements.keys()].join(",");
+  const source = new EventSource(
+    `${API_BASE_URL}/posts/summaries/stream?post_ids=${postIds}`,
+    { withCredentials: true }
+  );
+  summaryWatch.source = source;
+
+  const stop = () => {
+    source.close();
+    if (summaryWatch.source === source) summaryWatch.source = null;
+    summaryWatch.elements.clear();
+  };
+  const done = (postId) => {
+    summaryWatch.elements.delete(String(postId));
+    if (summaryWatch.elements.size === 0) stop();
+  };
+
+  source.addEventListener("summary", (e) => {
+    const data = JSON.parse(e.data);
+    const summaryEl = summaryWatch.elements.get(String(data.post_id));
+    if (summaryEl) summaryEl.textContent = data.summary || "";
+    done(data.post_id);
+  });
+  source.addEventListener("timeout", (e) => done(JSON.parse(e.data).post_id));
+  // 서버가 보낸 error 이벤트(삭제된 글)는 해당 글만, 연결 오류는 전체 중단
+  source.addEventListener("error", (e) => {
+    const data = e.data ? JSON.parse(e.data) : null;
+    if (data && data.post_id != null) done(data.post_id);
+    else stop();
+  });
+}
+
 // 버튼 활성/비활성
 function setButtonActive(button, active) {
   if (!button) return;
@@ -659,6 +703,7 @@ function initPostsPage() {
       }
 
       const posts = data.data.post_list;
+      const pendingSummaries = [];
       posts.forEach((post) => {
         const card = document.createElement("article");
         card.className = "post-card";
@@ -672,10 +717,14 @@ function initPostsPage() {
         card.innerHTML = `
           <div class="post-title">${title}</div>
           <div class="post-meta-row">
-            <div>좋아요 ${likes} · 댓글 ${comments} · 조회수 ${views}</div>
+            <div>${post.is_liked_by_me ? "♥ " : ""}좋아요 ${likes} · 댓글 ${comments} · 조회수 ${views}</div>
             <div>${post.created_at}</div>
           </div>
-          <div class="post-summary">${post.summary || ""}</div>
+          <div class="post-summary">${
+            post.summary_status === "pending"
+              ? "요약 생성 중..."
+              : post.summary || ""
+          }</div>
           <div class="post-author-row">
             <div class="post-author-avatar"></div>
             <div>${post.author_nickname}</div>
@@ -694,10 +743,19 @@ function initPostsPage() {
           window.location.href = `post_detail.html?postId=${post.post_id}`;
         });
 
+        if (post.summary_status === "pending") {
+          pendingSummaries.push([
+            post.post_id,
+            card.querySelector(".post-summary"),
+          ]);
+        }
+
         listEl.appendChild(card);
       });
 
-      if (data.data.next_cursor != null) {
+      if (pendingSummaries.length > 0) watchSummaries(pendingSummaries);
+
+      if (data.data.next_cursor != null && data.data.has_more !== false) {
         cursorId = data.data.next_cursor;
         hasMore = true;
         loadingEl.textContent = "아래로 스크롤하면 더 불러옵니다.";
@@ -1297,6 +1355,7 @@ async function initPostDetailPage() {
   const commentTextarea = document.getElementById("comment-textarea");
   const commentSubmitBtn = document.getElementById("comment-submit-btn");
   const commentsList = document.getElementById("comments-list");
+  const commentsMoreBtn = document.getElementById("comments-more-btn");
 
   const commentDeleteModal = document.getElementById("comment-delete-modal");
   const commentDeleteCancel = document.getElementById(
@@ -1310,6 +1369,7 @@ async function initPostDetailPage() {
   let likeId = null;
   let likeCount = 0;
   let totalCommentCount = 0;
+  let commentCursorId = 0;
 
   let editingCommentId = null;
   let pendingDeleteCommentId = null;
@@ -1367,6 +1427,7 @@ async function initPostDetailPage() {
       }
 
       renderComments(post.comments || []);
+      updateCommentsMore(post.comments_next_cursor, post.comments_has_more);
     } catch (err) {
       console.error(err);
       alert("게시글을 불러오지 못했습니다.");
@@ -1374,8 +1435,34 @@ async function initPostDetailPage() {
     }
   }
 
-  function renderComments(comments) {
-    commentsList.innerHTML = "";
+  // 댓글은 상세 응답에 첫 페이지만 오고, 나머지는 "댓글 더 보기"로 이어서 불러옴
+  function updateCommentsMore(nextCursor, hasMore) {
+    commentCursorId = nextCursor || 0;
+    commentsMoreBtn.style.display = hasMore ? "block" : "none";
+  }
+
+  commentsMoreBtn.addEventListener("click", async () => {
+    commentsMoreBtn.disabled = true;
+    try {
+      const { res, data } = await apiGet(`/posts/${postId}/comments`, {
+        query: { cursor_id: commentCursorId },
+      });
+      if (res.status !== 200 || data.detail !== "comments_list_success") {
+        alert("댓글을 불러오지 못했습니다.");
+        return;
+      }
+      renderComments(data.data.comment_list, { append: true });
+      updateCommentsMore(data.data.next_cursor, data.data.has_more);
+    } catch (err) {
+      console.error(err);
+      alert("댓글을 불러오지 못했습니다.");
+    } finally {
+      commentsMoreBtn.disabled = false;
+    }
+  });
+
+  function renderComments(comments, { append = false } = {}) {
+    if (!append) commentsList.innerHTML = "";
     comments.forEach((c) => {
       const item = document.createElement("div");
       item.className = "comment-item";